@@ -0,0 +1,69 @@
+"""Parity harness for the catalog store and the amazon export profile.
+
+Generates synthetic catalogs with repeated vehicle keys (so products fan out
+into several output rows), writes the pipeline output as ``main`` does, stores
+it in a scratch catalog store and checks that the ``amazon`` export is the
+same file, byte for byte.
+
+Run from ``src``::
+
+    python -m benchmarks.export_parity --rows 5000 --seeds 1 2 3
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+from benchmarks.legacy_parity import generate_catalog
+from config.profiles import DEFAULT_PROFILE
+from config.settings import BRAND_MAPPINGS_FILE, EXPORT_PROFILES
+from io_utils.catalog_store import CatalogStore
+from io_utils.file_writer import save_output
+from processors.brand_expander import load_brand_expander
+from processors.pipeline import transform
+
+
+def check_seed(rows: int, seed: int, expander, tmp: Path) -> bool:
+    """Compare the pipeline output file with the amazon export of the stored rows."""
+    products, vehicles = generate_catalog(rows, seed)
+    df_final = transform(products, vehicles, expander, DEFAULT_PROFILE)
+    fanned_out = int(df_final.duplicated(["PartNumber", "ASIN"]).sum())
+
+    output_file = tmp / f"output_{seed}.csv"
+    export_file = tmp / f"export_{seed}.csv"
+    save_output(df_final, output_file)
+    store = CatalogStore(tmp / f"catalog_{seed}.sqlite")
+    store.replace_all(df_final)
+    profile = EXPORT_PROFILES["amazon"]
+    exported = store.export(profile["columns"], matched_only=profile["matched_only"])
+    save_output(exported, export_file)
+
+    expected = output_file.read_bytes().splitlines()
+    actual = export_file.read_bytes().splitlines()
+    same = expected == actual
+    status = "✅ identical" if same else "❌ DIFFERENT"
+    print(f"seed {seed}: {len(df_final)} output rows ({fanned_out} fanned out), "
+          f"{store.count()} stored, {len(exported)} exported: {status}")
+    if not same:
+        mismatches = [i for i, (e, a) in enumerate(zip(expected, actual)) if e != a]
+        if len(expected) != len(actual):
+            print(f"  line count {len(expected)} != {len(actual)}")
+        for i in mismatches[:3]:
+            print(f"  line {i}:\n    output: {expected[i][:200]!r}\n    export: {actual[i][:200]!r}")
+    return same
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Catalog store export parity harness")
+    parser.add_argument("--rows", type=int, default=2000, help="Products per generated catalog")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3], help="Catalog seeds")
+    args = parser.parse_args(argv)
+    expander = load_brand_expander(BRAND_MAPPINGS_FILE)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [check_seed(args.rows, seed, expander, Path(tmp)) for seed in args.seeds]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Parity harness for the legacy profile.
+
+Generates synthetic catalogs and checks that the shared engine, run with
+``LEGACY_PROFILE``, produces exactly what the original ``merge_products.py``
+script produced. It also reports how the default profile differs from legacy.
+
+Run from ``src``::
+
+    python -m benchmarks.legacy_parity --rows 5000 --seeds 1 2 3
+"""
+import argparse
+import random
+import re
+import sys
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.profiles import DEFAULT_PROFILE, LEGACY_PROFILE
+from config.settings import BRAND_MAPPINGS_FILE, MERGED_DESC_COLUMN
+from io_utils.file_loader import load_brand_mappings
+from processors.brand_expander import load_brand_expander
+from processors.pipeline import transform
+
+MODELS = ["BMW 320i", "CHR Conquest", "DOG Colt", "HYU Santa Fe", "KIA Sephia",
+          "LEX GS430", "NIS Maxima", "INF I30", "ACU TSX", "FOR Probe", "MBZ C230"]
+PRODUCT_TYPES = ["Ignition Coil", "Oil Filter", '"Iridium" Spark Plug', "Brake Pad Set For"]
+CODES = ["(2171)", "(156)", "(K23A1)", "(VQ30DE)", "(3980)", "(SOHC)", "(1997)", ""]
+BULLETS = ["Matches OE form, fit and function",
+           "Made from premium materials to withstand high temperatures",
+           "Primary and secondary windings made from copper",
+           "Out of the box and straight onto the vehicle for easy installation",
+           "Application specific for this vehicle",
+           "Backed by a limited warranty",
+           "Tested to meet or exceed OE specifications"]
+
+
+def _fitment(rng: random.Random) -> str:
+    """One raw supplier fitment entry, e.g. '(2003-01) BMW 320i (2171)'."""
+    y1 = rng.choice([rng.randint(1980, 2025), rng.randint(0, 99)])
+    model = rng.choice(MODELS)
+    code = rng.choice(CODES)
+    if rng.random() < 0.5:
+        y2 = rng.choice([rng.randint(1980, 2025), rng.randint(0, 99)])
+        years = f"({y1:02d}-{y2:02d})"
+    else:
+        years = f"({y1})"
+    return f"{years} {model} {code}".strip()
+
+
+def generate_catalog(rows: int, seed: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Build a deterministic synthetic (products, vehicles) pair.
+
+    Includes lower-case and padded part numbers, unmatched parts, duplicate
+    vehicle keys, missing descriptions and bullets, and quoted titles.
+    """
+    rng = random.Random(seed)
+    part_numbers = [f"{rng.randint(100, 999)}-{rng.randint(1000, 9999)}" for _ in range(rows)]
+    products = pd.DataFrame({
+        "PartNumber": [p.lower() if rng.random() < 0.1 else f" {p} " if rng.random() < 0.1 else p
+                       for p in part_numbers],
+        "ASIN": [f"B0{rng.randint(0, 16**8 - 1):08X}" for _ in range(rows)],
+        "Title": [f"Beck/Arnley {p} {rng.choice(PRODUCT_TYPES)}" for p in part_numbers],
+        "URL": [f"https://www.amazon.com/dp/{p}" for p in part_numbers],
+        "Bullets": [np.nan if rng.random() < 0.05 else
+                    " | ".join(rng.sample(BULLETS, rng.randint(1, len(BULLETS))))
+                    for _ in range(rows)],
+        "CharCount": [rng.randint(100, 400) for _ in range(rows)]
+    })
+
+    keys = [p for p in part_numbers if rng.random() < 0.9]
+    keys += rng.sample(keys, min(len(keys), rows // 50))  # duplicate keys
+    descriptions = [
+        np.nan if rng.random() < 0.03 else
+        " * ".join(_fitment(rng) for _ in range(rng.randint(1, 12))) + " *"
+        for _ in keys
+    ]
+    vehicles = pd.DataFrame({col: "" for col in range(12)}, index=range(len(keys)))
+    vehicles[0] = keys
+    vehicles[11] = descriptions
+    header = pd.DataFrame([["Catalog Part Number"] + [""] * 10 + ["Application"]])
+    return products, pd.concat([header, vehicles], ignore_index=True)
+
+
+def legacy_reference(df1: pd.DataFrame, df2: pd.DataFrame, abbr_map: dict) -> pd.DataFrame:
+    """Transformations of the original merge_products.py script, kept verbatim."""
+    df1["PartNumber"] = df1["PartNumber"].astype(str).str.strip().str.upper()
+    df2[0] = df2[0].astype(str).str.strip().str.upper()
+    df_merged = pd.merge(df1, df2[[0, 11]], left_on="PartNumber", right_on=0, how='left')
+    df_merged.rename(columns={11: "Merged Description"}, inplace=True)
+
+    df_merged["Title"] = df_merged["Title"].apply(lambda x: x.strip().replace('"', '') if isinstance(x, str) else x)
+    df_merged["Title"] = df_merged["Title"].apply(lambda x: x + " For" if isinstance(x, str) and not x.endswith("For") else x)
+    df_merged["Merged Description"] = df_merged["Merged Description"].apply(
+        lambda x: f"VEHICLE FIT: {x.strip()}" if isinstance(x, str) and not x.startswith("VEHICLE FIT:") else x
+    )
+
+    def replace_abbrs(text):
+        if not isinstance(text, str):
+            return text
+        for abbr, full in abbr_map.items():
+            text = text.replace(abbr, full)
+        return text
+    df_merged["Merged Description"] = df_merged["Merged Description"].apply(replace_abbrs)
+
+    def normalize_model_year_blocks(text):
+        if not isinstance(text, str):
+            return text
+        pattern = re.compile(r'\((\d{2,4})-(\d{2,4})\)\s+([^*]+)')
+        matches = pattern.findall(text)
+        normalized_blocks = []
+        for y1, y2, model in matches:
+            y1, y2 = int(y1), int(y2)
+            y1 = 1900 + y1 if y1 < 100 and y1 >= 80 else 2000 + y1 if y1 < 100 else y1
+            y2 = 1900 + y2 if y2 < 100 and y2 >= 80 else 2000 + y2 if y2 < 100 else y2
+            low, high = sorted([y1, y2])
+            normalized_blocks.append(f"{model.strip()} ({low}-{high})")
+        return "VEHICLE FIT: " + ", ".join(normalized_blocks) if normalized_blocks else text
+    df_merged["Merged Description"] = df_merged["Merged Description"].apply(normalize_model_year_blocks)
+    df_merged["Merged Description"] = df_merged["Merged Description"].apply(
+        lambda x: str(x).replace(" *", "") if pd.notnull(x) else x
+    )
+
+    def enrich_title(row):
+        title = row["Title"]
+        desc = row["Merged Description"]
+        if not isinstance(title, str) or not isinstance(desc, str):
+            return title
+        desc_clean = desc.replace("VEHICLE FIT:", "").strip()
+        matches = re.findall(r'(.+?)\s+\((\d{4})-(\d{4})\)', desc_clean)
+        if len(matches) == 1:
+            model, y1, y2 = matches[0]
+            vehicle_info = f"{y1}-{y2} {model.strip()}"
+            return title.replace("For", f"For {vehicle_info}")
+        return title
+    df_merged["Title"] = df_merged.apply(enrich_title, axis=1)
+
+    if "Bullets" in df_merged.columns:
+        df_merged["Bullets"] = df_merged["Bullets"].apply(
+            lambda x: x.replace(" | ", "@") if isinstance(x, str) else x
+        )
+        split_bullets = df_merged["Bullets"].apply(
+            lambda x: [b.strip() for b in str(x).split('@')] if pd.notnull(x) else []
+        )
+        max_bullets = min(5, split_bullets.map(len).max())
+        for i in range(max_bullets):
+            df_merged[f"bullet0{i+1}"] = split_bullets.apply(lambda b: b[i] if i < len(b) else "")
+
+    if 0 in df_merged.columns:
+        df_merged.drop(columns=[0], inplace=True)
+    if "URL" in df_merged.columns:
+        url_col = df_merged.pop("URL")
+        df_merged["URL"] = url_col
+    bullet_cols = [col for col in df_merged.columns if col.startswith("bullet")]
+    final_columns = ["PartNumber", "ASIN", "Title", "Merged Description", "URL"] + bullet_cols
+    return df_merged[[col for col in final_columns if col in df_merged.columns]]
+
+
+def _differing_rows(a: pd.DataFrame, b: pd.DataFrame, column: str) -> int:
+    return int((a[column].fillna("<NA>").astype(str) != b[column].fillna("<NA>").astype(str)).sum())
+
+
+def check_seed(rows: int, seed: int, brand_mappings: dict, expander) -> bool:
+    """Compare legacy reference and engine output for one generated catalog.
+
+    The reference gets the raw CSV mapping, as the original script did; the
+    engine gets the compiled expander, as ``main`` does.
+    """
+    products, vehicles = generate_catalog(rows, seed)
+    expected = legacy_reference(products.copy(), vehicles.copy(), brand_mappings)
+    actual = transform(products.copy(), vehicles.copy(), expander, LEGACY_PROFILE)
+    default = transform(products.copy(), vehicles.copy(), expander, DEFAULT_PROFILE)
+
+    expected_csv = expected.to_csv(index=False).splitlines()
+    actual_csv = actual.to_csv(index=False).splitlines()
+    same = expected_csv == actual_csv
+    status = "✅ identical" if same else "❌ DIFFERENT"
+    print(f"seed {seed}: {len(expected)} rows, legacy profile vs legacy script: {status}")
+    if not same:
+        mismatches = [i for i, (e, a) in enumerate(zip(expected_csv, actual_csv)) if e != a]
+        if len(expected_csv) != len(actual_csv):
+            print(f"  line count {len(expected_csv)} != {len(actual_csv)}")
+        for i in mismatches[:3]:
+            print(f"  line {i}:\n    script: {expected_csv[i][:200]}\n    engine: {actual_csv[i][:200]}")
+    print(f"  default vs legacy profile: {_differing_rows(default, actual, MERGED_DESC_COLUMN)} descriptions, "
+          f"{_differing_rows(default, actual, 'Title')} titles differ")
+    return same
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Legacy profile parity harness")
+    parser.add_argument("--rows", type=int, default=2000, help="Products per generated catalog")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3], help="Catalog seeds")
+    args = parser.parse_args(argv)
+    brand_mappings = load_brand_mappings(BRAND_MAPPINGS_FILE)
+    expander = load_brand_expander(BRAND_MAPPINGS_FILE)
+    results = [check_seed(args.rows, seed, brand_mappings, expander) for seed in args.seeds]
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Microbenchmark asserting the normalizers scale linearly with fitment count.
+
+Feeds worst-case descriptions (thousands of fitments per part) through each
+normalization step and the title enrichment, and fails when time grows faster
+than linearly with the description length.
+
+Run from ``src``::
+
+    python -m benchmarks.regex_scaling
+"""
+import argparse
+import math
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from io_utils.file_loader import load_brand_mappings
+from config.settings import BRAND_MAPPINGS_FILE
+from processors.product_enricher import build_normalization_steps, enrich_title
+
+# Raw fitment entries cycled to build long descriptions
+FITMENT_ENTRIES = [
+    "(2003-01) BMW 320i (2171)",
+    "(2000) BMW 323Ci (2494)",
+    "(1989-87) CHR Conquest (156)",
+    "(2007-02) HYU Sonata (2359)",
+    "(1997-89) FOR Probe",
+    "(2009-03) LEX GX470 (4663)",
+    "(2004) ACU TSX (K24A2)",
+    "(1986) DOG Power Ram 50 (156)"
+]
+
+# Single-year entries only: no year range anywhere, the worst case for the
+# lazy model group in title enrichment
+SINGLE_YEAR_ENTRIES = [
+    "(2002) HON Accord (2354)",
+    "(2011) KIA Soul (1591)",
+    "(2009) NIS Murano (3498)"
+]
+
+DEFAULT_SIZES = [1000, 2000, 4000, 8000]
+DEFAULT_MAX_EXPONENT = 1.3
+
+
+def build_description(entries: List[str], fitments: int) -> str:
+    """Join ``fitments`` raw entries with the supplier's ' * ' separator."""
+    return " * ".join(entries[i % len(entries)] for i in range(fitments)) + " *"
+
+
+def time_call(func: Callable, arg, repeats: int) -> float:
+    """Best-of-``repeats`` wall time of ``func(arg)`` in seconds."""
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_steps(description: str, steps: List[Tuple[str, Callable]],
+               repeats: int) -> Dict[str, float]:
+    """Time every step on the output of the steps before it."""
+    timings = {}
+    text = description
+    for name, step in steps:
+        timings[name] = time_call(step, text, repeats)
+        text = step(text)
+    timings["enrich_title"] = time_call(lambda d: enrich_title("Part For", d), text, repeats)
+    return timings
+
+
+def scaling_exponent(sizes: List[int], times: List[float]) -> float:
+    """Exponent k in time ~ size**k between the smallest and largest size."""
+    if times[0] <= 0:
+        return 0.0
+    return math.log(times[-1] / times[0]) / math.log(sizes[-1] / sizes[0])
+
+
+def run(sizes: List[int], repeats: int, max_exponent: float) -> bool:
+    """Run the benchmark, print a table and return True if scaling is linear."""
+    steps = build_normalization_steps(load_brand_mappings(BRAND_MAPPINGS_FILE))
+    ok = True
+    for label, entries in [("mixed fitments", FITMENT_ENTRIES),
+                           ("single-year fitments", SINGLE_YEAR_ENTRIES)]:
+        results = [time_steps(build_description(entries, n), steps, repeats) for n in sizes]
+        print(f"\n{label}: time per call (ms) by fitment count")
+        print(f"{'step':<40}" + "".join(f"{n:>10}" for n in sizes) + f"{'exponent':>10}")
+        for name in results[0]:
+            times = [r[name] for r in results]
+            exponent = scaling_exponent(sizes, times)
+            status = "" if exponent <= max_exponent else "  SUPERLINEAR"
+            ok = ok and exponent <= max_exponent
+            print(f"{name:<40}" + "".join(f"{t * 1000:>10.3f}" for t in times)
+                  + f"{exponent:>10.2f}{status}")
+    return ok
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Fitment counts per description")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Timing repeats per step (best is kept)")
+    parser.add_argument("--max-exponent", type=float, default=DEFAULT_MAX_EXPONENT,
+                        help="Largest accepted scaling exponent (1.0 is linear)")
+    args = parser.parse_args(argv)
+    if run(sorted(args.sizes), args.repeats, args.max_exponent):
+        print("\n✅ All steps scale linearly.")
+        return 0
+    print(f"\n❌ Some steps scale worse than size**{args.max_exponent}.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""Per-stage throughput budgets, normalized by a machine-speed calibration.
+
+Builds a deterministic synthetic catalog from the samples in ``data/`` (the
+product rows as templates, the vehicle compatibility sheet as the source of
+part numbers and descriptions), times the loaders, ``merge_vehicle_data``,
+``enrich_product_data`` and ``split_bullets`` on it, and compares each stage
+with the budget recorded in ``stage_budgets.json``. Everything runs offline.
+
+Throughput is normalized by a fixed calibration workload timed right before
+each stage: a stage's score is rows processed per calibration run time, so
+faster or slower hosts (or a shared host slowing down mid-run) shift the
+calibration and the stage together.
+
+Run from ``src``::
+
+    python -m benchmarks.stage_budgets
+    python -m benchmarks.stage_budgets --record --rounds 3   # after an intended speed change
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import math
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from benchmarks.legacy_parity import BULLETS
+from config.settings import BRAND_MAPPINGS_FILE, INPUT_PRODUCT_FILE, INPUT_VEHICLE_FILE
+from io_utils.file_loader import load_product_data, load_vehicle_data
+from processors.brand_expander import load_brand_expander
+from processors.product_enricher import enrich_product_data
+from processors.vehicle_matcher import merge_vehicle_data
+from utils.data_cleaner import split_bullets
+
+BUDGETS_FILE = Path(__file__).with_name("stage_budgets.json")
+DEFAULT_ROWS = 50_000
+DEFAULT_SEED = 7
+# A stage fails when its normalized throughput drops below (1 - tolerance) x budget
+DEFAULT_TOLERANCE = 0.35
+# Share of generated products whose part number is not in the vehicle sheet
+UNMATCHED_SHARE = 0.1
+# Share of generated products without bullets
+MISSING_BULLETS_SHARE = 0.05
+
+CALIBRATION_TEXTS = [f"({1980 + i % 45}-{i % 100:02d}) MAKE Model {i % 613} (K{i % 97}A{i % 7})"
+                     for i in range(20_000)]
+CALIBRATION_PATTERN = re.compile(r"\((\d{2,4})-(\d{2,4})\)\s+([^*(]+)")
+
+
+def calibration_workload():
+    """Fixed mix of regex, Python string and pandas string work, like the pipeline's."""
+    matches = [CALIBRATION_PATTERN.findall(text) for text in CALIBRATION_TEXTS]
+    joined = [", ".join(f"{m[2].strip()} ({m[0]}-{m[1]})" for m in found) for found in matches]
+    series = pd.Series(joined, dtype=object)
+    series.str.upper().str.replace("MODEL", "Model", regex=False).str.split(" ").str.len()
+    sorted(joined, key=len)
+
+
+CALIBRATION_REPEATS = 5
+
+
+def best_time(func: Callable[..., object], repeats: int,
+              setup: Optional[Callable[[], tuple]] = None) -> float:
+    """Best-of-``repeats`` wall time of ``func(*setup())``; setup is not timed.
+
+    The garbage collector is paused while timing, as ``timeit`` does.
+    """
+    best = math.inf
+    for _ in range(repeats):
+        args = setup() if setup is not None else ()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func(*args)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def time_stage(func: Callable[..., object], repeats: int,
+               setup: Optional[Callable[[], tuple]] = None) -> Tuple[float, float]:
+    """Return (calibration seconds, stage seconds), calibrating just before the stage."""
+    calibration = best_time(calibration_workload, CALIBRATION_REPEATS)
+    return calibration, best_time(func, repeats, setup)
+
+
+def generate_catalog(vehicle_df: pd.DataFrame, rows: int, seed: int) -> pd.DataFrame:
+    """Scale the sample products up to ``rows`` rows with real vehicle part numbers.
+
+    Each row copies a template row from ``data/products.csv`` with a part
+    number drawn from the vehicle sheet (some lower-cased or padded, some
+    unknown), so merges and enrichment see the real description mix. Bullets
+    are a seeded subset of ``legacy_parity.BULLETS`` in a seeded order (some
+    missing, some longer than ``MAX_BULLETS``), so bullet splitting sees
+    many distinct values rather than the templates' single one.
+    """
+    rng = random.Random(seed)
+    templates = pd.read_csv(INPUT_PRODUCT_FILE).to_dict("records")
+    keys = vehicle_df[0].iloc[1:].dropna().astype(str).tolist()
+    records = []
+    for i in range(rows):
+        template = templates[i % len(templates)]
+        if rng.random() < UNMATCHED_SHARE:
+            part = f"{rng.randint(100, 999)}-{rng.randint(10000, 99999)}"
+        else:
+            part = rng.choice(keys)
+        shown = part.lower() if rng.random() < 0.05 else f" {part} " if rng.random() < 0.05 else part
+        records.append({
+            **template,
+            "PartNumber": shown,
+            "ASIN": f"B0{rng.randint(0, 16**8 - 1):08X}",
+            "Title": template["Title"].replace(str(template["PartNumber"]), part),
+            "Bullets": math.nan if rng.random() < MISSING_BULLETS_SHARE else
+            " | ".join(rng.sample(BULLETS, rng.randint(1, len(BULLETS))))
+        })
+    return pd.DataFrame(records, columns=list(templates[0]))
+
+
+def time_stages(rows: int, seed: int, repeats: int) -> Dict[str, Tuple[int, float, float]]:
+    """Time every stage on the synthetic catalog.
+
+    Returns:
+        Stage name -> (rows processed, calibration seconds, best stage seconds)
+    """
+    results = {}
+    quiet = contextlib.redirect_stdout(io.StringIO())
+    vehicle_df = load_vehicle_data(INPUT_VEHICLE_FILE)
+    results["load_vehicle_data"] = (len(vehicle_df), *time_stage(
+        lambda: load_vehicle_data(INPUT_VEHICLE_FILE), repeats))
+
+    products = generate_catalog(vehicle_df, rows, seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        product_file = Path(tmp) / "products.csv"
+        products.to_csv(product_file, index=False)
+        results["load_product_data"] = (rows, *time_stage(
+            lambda: load_product_data(product_file), repeats))
+        products = load_product_data(product_file)
+
+    with quiet:
+        results["merge_vehicle_data"] = (rows, *time_stage(
+            merge_vehicle_data, repeats, lambda: (products.copy(), vehicle_df.copy())))
+        merged = merge_vehicle_data(products.copy(), vehicle_df.copy())
+
+    brand_mappings = load_brand_expander(BRAND_MAPPINGS_FILE)
+    results["enrich_product_data"] = (len(merged), *time_stage(
+        lambda df: enrich_product_data(df, brand_mappings), repeats, lambda: (merged.copy(),)))
+    enriched = enrich_product_data(merged.copy(), brand_mappings)
+    results["split_bullets"] = (len(enriched), *time_stage(
+        split_bullets, repeats, lambda: (enriched.copy(),)))
+    return results
+
+
+def normalized_throughput(results: Dict[str, Tuple[int, float, float]]) -> Dict[str, float]:
+    """Rows per stage per calibration run time (rows/s x calibration seconds)."""
+    return {stage: rows / seconds * calibration for stage, (rows, calibration, seconds) in results.items()}
+
+
+def median_results(rounds: List[Dict[str, Tuple[int, float, float]]]) -> Dict[str, Tuple[int, float, float]]:
+    """Per stage, keep the round with the median normalized throughput (the lower one for even counts)."""
+    chosen = {}
+    for stage in rounds[0]:
+        ordered = sorted((r[stage] for r in rounds), key=lambda t: t[0] / t[2] * t[1])
+        chosen[stage] = ordered[(len(ordered) - 1) // 2]
+    return chosen
+
+
+def print_table(results: Dict[str, Tuple[int, float, float]], scores: Dict[str, float],
+                budgets: Dict[str, float], tolerance: float) -> List[str]:
+    """Print measured vs budgeted throughput per stage; return the failing stages."""
+    failed = []
+    print(f"\n{'stage':<22}{'rows':>9}{'rows/s':>12}{'calib ms':>10}{'score':>10}{'budget':>10}{'ratio':>8}  status")
+    for stage, (rows, calibration, seconds) in results.items():
+        budget = budgets.get(stage)
+        if budget is None:
+            ratio, status = math.nan, "no budget"
+        else:
+            ratio = scores[stage] / budget
+            status = "ok" if ratio >= 1 - tolerance else "OVER BUDGET"
+            if status != "ok":
+                failed.append(stage)
+        budget_text = f"{budget:>10.0f}" if budget is not None else f"{'-':>10}"
+        print(f"{stage:<22}{rows:>9}{rows / seconds:>12,.0f}{calibration * 1000:>10.1f}{scores[stage]:>10.0f}"
+              f"{budget_text}{ratio:>8.2f}  {status}")
+    return failed
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_FILE, help="Budgets JSON file")
+    parser.add_argument("--rows", type=int, help="Synthetic products (default: as recorded)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timing repeats per stage (best is kept)")
+    parser.add_argument("--rounds", type=int, default=1,
+                        help="Full measurement rounds; each stage's median round is used (use 3+ with --record)")
+    parser.add_argument("--tolerance", type=float,
+                        help=f"Accepted shortfall below budget (default: as recorded, else {DEFAULT_TOLERANCE})")
+    parser.add_argument("--record", action="store_true",
+                        help="Write the measured scores as the new budgets instead of checking")
+    args = parser.parse_args(argv)
+
+    recorded = json.loads(args.budgets.read_text(encoding="utf-8")) if args.budgets.exists() else {}
+    if not recorded and not args.record:
+        print(f"❌ No budgets in {args.budgets}; run with --record first.")
+        return 2
+    rows = args.rows or recorded.get("rows", DEFAULT_ROWS)
+    seed = recorded.get("seed", DEFAULT_SEED)
+    tolerance = args.tolerance if args.tolerance is not None else recorded.get("tolerance", DEFAULT_TOLERANCE)
+    if not args.record and recorded and rows != recorded.get("rows"):
+        print(f"⚠️ Budgets were recorded for {recorded.get('rows')} rows, not {rows}.")
+
+    print(f"Synthetic catalog: {rows} rows, seed {seed}, {args.rounds} round(s)")
+    results = median_results([time_stages(rows, seed, args.repeats) for _ in range(max(args.rounds, 1))])
+    scores = normalized_throughput(results)
+
+    if args.record:
+        budgets = {
+            "rows": rows,
+            "seed": seed,
+            "tolerance": tolerance,
+            "unit": "rows per calibration run time",
+            "stages": {stage: round(score, 1) for stage, score in scores.items()}
+        }
+        args.budgets.write_text(json.dumps(budgets, indent=2) + "\n", encoding="utf-8")
+        print_table(results, scores, budgets["stages"], tolerance)
+        print(f"\n📝 Recorded budgets to {args.budgets}")
+        return 0
+
+    failed = print_table(results, scores, recorded.get("stages", {}), tolerance)
+    if failed:
+        print(f"\n❌ Over budget (more than {tolerance:.0%} below the recorded throughput): {', '.join(failed)}")
+        return 1
+    print("\n✅ All stages within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+"""Run configuration loaded from a TOML/YAML file with environment overrides.
+
+Tuning knobs default to the constants in ``config.settings``. A config file
+(``product_merge.toml`` next to ``src`` by default, or ``--config`` /
+``PRODUCT_MERGE_CONFIG``) may override them and define extra run profiles::
+
+    enrich_chunk_size = 200000
+    string_storage = "pyarrow"
+    csv_engine = "c"
+    merge_strategy = "sorted"
+    max_memory = "4G"
+
+    [profiles.nightly]
+    base = "default"
+    product_file = "/mnt/feeds/products.csv"
+    output_file = "/mnt/out/nightly.csv"
+
+A profile that sets ``output_file`` writes its quarantine file, catalog store
+and trace next to it (``nightly.quarantine.csv``, ``nightly.catalog.sqlite``,
+``nightly.trace.jsonl``) unless it sets those paths too.
+
+Environment variables named ``PRODUCT_MERGE_<KNOB>`` (e.g.
+``PRODUCT_MERGE_ENRICH_CHUNK_SIZE``) override the file. The result is
+validated once at startup and then read through ``get_config()``.
+"""
+import codecs
+import importlib.util
+import os
+import tomllib
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from config.profiles import PROFILES, SIDE_FILE_FIELDS, PipelineProfile, side_file
+from config.settings import (
+    CONFIG_FILE,
+    CONFIG_ENV_PREFIX,
+    WORK_DIR,
+    ENRICH_CHUNK_SIZE,
+    LOAD_CHUNK_SIZE,
+    STRING_STORAGE
+)
+from utils.memory import parse_memory_size
+
+CONFIG_ENV_VAR = f"{CONFIG_ENV_PREFIX}CONFIG"
+
+# Allowed values for knobs that select an implementation
+KNOB_CHOICES = {
+    "string_storage": ("object", "pyarrow"),
+    "csv_engine": ("python", "c", "pyarrow"),
+    "excel_engine": ("openpyxl", "calamine"),
+    "merge_strategy": ("hash", "sorted")
+}
+
+# Optional packages a knob choice needs, checked at startup rather than mid-run
+KNOB_CHOICE_MODULES = {
+    ("string_storage", "pyarrow"): "pyarrow",
+    ("csv_engine", "pyarrow"): "pyarrow",
+    ("excel_engine", "calamine"): "python_calamine"
+}
+
+# Integer knobs where 0 means "off" or "library default"
+ZERO_ALLOWED_KNOBS = ("write_chunk_size", "shard_max_rows", "shard_max_bytes", "max_memory")
+
+PROFILE_PATH_FIELDS = ("product_file", "vehicle_file", "brand_mappings_file", "output_file") + tuple(SIDE_FILE_FIELDS)
+
+
+@dataclass(frozen=True)
+class RunConfig:
+    """Per-host tuning knobs and the run profiles available to the CLI."""
+
+    # Checkpoint/cache directory
+    work_dir: Path = WORK_DIR
+    # Rows per enrichment partition (and checkpoint)
+    enrich_chunk_size: int = ENRICH_CHUNK_SIZE
+    # Rows per chunk when reading products into Arrow-backed strings
+    load_chunk_size: int = LOAD_CHUNK_SIZE
+    string_storage: str = STRING_STORAGE
+    # pandas read_csv / read_excel engines
+    csv_engine: str = "python"
+    excel_engine: str = "openpyxl"
+    # "sorted" streams inputs already sorted by part number through a merge join
+    merge_strategy: str = "hash"
+    output_encoding: str = "utf-8"
+    # Rows per to_csv write batch; 0 keeps the pandas default
+    write_chunk_size: int = 0
+    # Split the output into part files of at most this many rows / bytes; 0 disables
+    shard_max_rows: int = 0
+    shard_max_bytes: int = 0
+    # Processes encoding output shards in parallel
+    write_workers: int = min(4, os.cpu_count() or 1)
+    # Memory budget in bytes (the file and environment also accept e.g. "4G"); 0 disables
+    max_memory: int = 0
+    profiles: Dict[str, PipelineProfile] = field(default_factory=lambda: dict(PROFILES))
+
+    def profile(self, name: str) -> PipelineProfile:
+        """Return a run profile by name.
+
+        Raises:
+            ValueError: If no profile has that name
+        """
+        if name not in self.profiles:
+            raise ValueError(f"Unknown profile '{name}'; available: {', '.join(sorted(self.profiles))}")
+        return self.profiles[name]
+
+
+KNOB_NAMES = [f.name for f in fields(RunConfig) if f.name != "profiles"]
+
+_active_config = RunConfig()
+
+
+def get_config() -> RunConfig:
+    """Return the configuration validated at startup (defaults if none was loaded)."""
+    return _active_config
+
+
+def set_config(config: RunConfig):
+    """Make ``config`` the configuration returned by ``get_config()``."""
+    global _active_config
+    _active_config = config
+
+
+def _read_file(path: Path) -> Dict[str, Any]:
+    """Parse a config file; every read or parse problem is raised as ValueError."""
+    try:
+        if path.suffix in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(f"{path}: YAML config files need PyYAML (pip install pyyaml)")
+            with open(path, "r", encoding="utf-8") as f:
+                try:
+                    data = yaml.safe_load(f) or {}
+                except yaml.YAMLError as e:
+                    raise ValueError(f"{path}: invalid YAML: {e}")
+        elif path.suffix == ".toml":
+            with open(path, "rb") as f:
+                try:
+                    data = tomllib.load(f)
+                except tomllib.TOMLDecodeError as e:
+                    raise ValueError(f"{path}: invalid TOML: {e}")
+        else:
+            raise ValueError(f"Unsupported config format '{path.suffix}' (use .toml, .yaml or .yml)")
+    except OSError as e:
+        raise ValueError(f"Cannot read config file {path}: {e.strerror or e}")
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: top level must be a mapping")
+    return data
+
+
+def _coerce_knob(name: str, value: Any, errors: list) -> Any:
+    """Convert a file or environment value to the knob's type, recording problems."""
+    default = getattr(RunConfig, name)
+    try:
+        if isinstance(default, Path):
+            return Path(value)
+        if isinstance(default, int):
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError
+            value = parse_memory_size(value) if name == "max_memory" and isinstance(value, str) else int(value)
+            if value < 0 or (value == 0 and name not in ZERO_ALLOWED_KNOBS):
+                errors.append(f"{name}: must be positive, got {value}")
+            return value
+        value = str(value)
+    except (TypeError, ValueError):
+        errors.append(f"{name}: expected {type(default).__name__}, got {value!r}")
+        return default
+    if name in KNOB_CHOICES and value not in KNOB_CHOICES[name]:
+        errors.append(f"{name}: expected one of {', '.join(KNOB_CHOICES[name])}, got {value!r}")
+    module = KNOB_CHOICE_MODULES.get((name, value))
+    if module is not None and importlib.util.find_spec(module) is None:
+        errors.append(f"{name}: {value!r} needs the {module} package, which is not installed")
+    if name == "output_encoding":
+        try:
+            codecs.lookup(value)
+        except LookupError:
+            errors.append(f"{name}: unknown encoding {value!r}")
+    return value
+
+
+def _build_profiles(raw: Any, base_dir: Path, errors: list) -> Dict[str, PipelineProfile]:
+    """Derive file-defined profiles from built-in ones (``base``, default "default")."""
+    # Imported here: the enricher imports the loaders, which read this module
+    from processors.product_enricher import NORMALIZATION_STEP_NAMES
+    profiles = dict(PROFILES)
+    if not isinstance(raw, dict):
+        errors.append("profiles: must be a table of profile tables")
+        return profiles
+    profile_fields = {f.name for f in fields(PipelineProfile)} - {"name"}
+    for name, overrides in raw.items():
+        if not isinstance(overrides, dict):
+            errors.append(f"profiles.{name}: must be a table")
+            continue
+        overrides = dict(overrides)
+        base = overrides.pop("base", "default")
+        if base not in profiles:
+            errors.append(f"profiles.{name}: unknown base profile '{base}'")
+            continue
+        unknown = sorted(set(overrides) - profile_fields)
+        if unknown:
+            errors.append(f"profiles.{name}: unknown keys {', '.join(unknown)}")
+            continue
+        problems = []
+        for key, value in overrides.items():
+            if key in PROFILE_PATH_FIELDS:
+                overrides[key] = base_dir / Path(str(value)).expanduser()
+            elif key == "step_names" and value is not None:
+                if not isinstance(value, list):
+                    problems.append(f"profiles.{name}.step_names: expected a list, got {value!r}")
+                    continue
+                unknown_steps = [step for step in value if step not in NORMALIZATION_STEP_NAMES]
+                if unknown_steps:
+                    problems.append(f"profiles.{name}.step_names: unknown steps {unknown_steps}")
+                overrides[key] = tuple(value)
+            elif key != "step_names" and type(value) is not type(getattr(profiles[base], key)):
+                problems.append(f"profiles.{name}.{key}: expected "
+                                f"{type(getattr(profiles[base], key)).__name__}, got {value!r}")
+        if problems:
+            errors.extend(problems)
+            continue
+        if "output_file" in overrides:
+            # A new output gets its own side files unless they are set explicitly
+            for side in SIDE_FILE_FIELDS:
+                overrides.setdefault(side, side_file(overrides["output_file"], side))
+        profiles[name] = replace(profiles[base], name=name, **overrides)
+    return profiles
+
+
+def load_config(config_file: Optional[str] = None,
+                environ: Optional[Mapping[str, str]] = None) -> RunConfig:
+    """Load and validate the run configuration.
+
+    Args:
+        config_file: TOML or YAML file; falls back to ``PRODUCT_MERGE_CONFIG``,
+            then to ``settings.CONFIG_FILE`` if it exists
+        environ: Environment to read overrides from (defaults to ``os.environ``)
+
+    Returns:
+        Validated RunConfig
+
+    Raises:
+        ValueError: If the file cannot be read or parsed, or listing every
+            invalid key or value
+    """
+    environ = os.environ if environ is None else environ
+    path = config_file or environ.get(CONFIG_ENV_VAR)
+    if path is None and CONFIG_FILE.exists():
+        path = CONFIG_FILE
+    data = _read_file(Path(path)) if path is not None else {}
+
+    errors = []
+    values = {}
+    profiles = dict(PROFILES)
+    for key, value in data.items():
+        if key == "profiles":
+            profiles = _build_profiles(value, Path(path).resolve().parent, errors)
+        elif key in KNOB_NAMES:
+            values[key] = _coerce_knob(key, value, errors)
+        else:
+            errors.append(f"{key}: unknown setting")
+    for name in KNOB_NAMES:
+        env_value = environ.get(f"{CONFIG_ENV_PREFIX}{name.upper()}")
+        if env_value is not None:
+            values[name] = _coerce_knob(name, env_value, errors)
+
+    if errors:
+        source = f" in {path}" if path is not None else ""
+        raise ValueError(f"Invalid configuration{source}:\n  " + "\n  ".join(errors))
+    return RunConfig(profiles=profiles, **values)
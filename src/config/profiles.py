@@ -0,0 +1,85 @@
+"""Run profiles: which inputs, steps and output conventions a pipeline run uses."""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+from config.settings import (
+    DATA_DIR,
+    INPUT_PRODUCT_FILE,
+    INPUT_VEHICLE_FILE,
+    BRAND_MAPPINGS_FILE,
+    OUTPUT_FILE,
+    QUARANTINE_FILE,
+    CATALOG_DB_FILE,
+    TRACE_FILE
+)
+
+# Side files a run writes next to its output: profile field -> (kind, suffix)
+SIDE_FILE_FIELDS = {
+    "quarantine_file": ("quarantine", ".csv"),
+    "catalog_db_file": ("catalog", ".sqlite"),
+    "trace_file": ("trace", ".jsonl")
+}
+
+
+def side_file(output_file: Path, field_name: str) -> Path:
+    """Derive a side file path from an output path, e.g. ``out.quarantine.csv``."""
+    kind, suffix = SIDE_FILE_FIELDS[field_name]
+    return output_file.with_name(f"{output_file.stem}.{kind}{suffix}")
+
+
+@dataclass(frozen=True)
+class PipelineProfile:
+    """Settings that distinguish one pipeline variant from another."""
+
+    name: str
+    product_file: Path
+    vehicle_file: Path
+    brand_mappings_file: Path
+    output_file: Path
+    # Rows failing validation, the enriched catalog store and the trace records
+    quarantine_file: Path
+    catalog_db_file: Path
+    trace_file: Path
+    # Description normalization steps, in order; None runs every step
+    step_names: Optional[Tuple[str, ...]] = None
+    bullet_column_format: str = "bullet{:02d}"
+    # Quarantine invalid rows instead of passing them through
+    validate_rows: bool = True
+    # Refresh the enriched catalog store after writing the output
+    store_catalog: bool = True
+
+
+DEFAULT_PROFILE = PipelineProfile(
+    name="default",
+    product_file=INPUT_PRODUCT_FILE,
+    vehicle_file=INPUT_VEHICLE_FILE,
+    brand_mappings_file=BRAND_MAPPINGS_FILE,
+    output_file=OUTPUT_FILE,
+    quarantine_file=QUARANTINE_FILE,
+    catalog_db_file=CATALOG_DB_FILE,
+    trace_file=TRACE_FILE
+)
+
+# Reproduces the original merge_products.py script: its file names, only the
+# first four description steps, and no row validation or catalog store
+LEGACY_PROFILE = PipelineProfile(
+    name="legacy",
+    product_file=DATA_DIR / "file_001.csv",
+    vehicle_file=DATA_DIR / "file_002.xlsx",
+    brand_mappings_file=DATA_DIR / "car_brands_abbreviations.csv",
+    output_file=DATA_DIR / "file_001_updated.csv",
+    quarantine_file=side_file(DATA_DIR / "file_001_updated.csv", "quarantine_file"),
+    catalog_db_file=side_file(DATA_DIR / "file_001_updated.csv", "catalog_db_file"),
+    trace_file=TRACE_FILE,
+    step_names=(
+        "prepend_vehicle_fit",
+        "replace_abbrs",
+        "normalize_model_year_blocks",
+        "remove_trailing_star"
+    ),
+    bullet_column_format="bullet0{}",
+    validate_rows=False,
+    store_catalog=False
+)
+
+PROFILES = {profile.name: profile for profile in [DEFAULT_PROFILE, LEGACY_PROFILE]}
@@ -5,6 +5,10 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = BASE_DIR / "data"
 
+# Run configuration file (optional) and environment override prefix
+CONFIG_FILE = BASE_DIR / "product_merge.toml"
+CONFIG_ENV_PREFIX = "PRODUCT_MERGE_"
+
 # Input/Output file paths
 INPUT_PRODUCT_FILE = DATA_DIR / "products.csv"
 INPUT_VEHICLE_FILE = DATA_DIR / "vehicle_compatibility.xlsx"
@@ -24,4 +28,53 @@ MERGED_DESC_COLUMN = "Merged Description"
 VEHICLE_FIT_PREFIX = "VEHICLE FIT: "
 
 # Maximum number of bullet points to process
-MAX_BULLETS = 5 
\ No newline at end of file
+MAX_BULLETS = 5
+
+# Row validation and quarantine
+QUARANTINE_FILE = DATA_DIR / "products_quarantine.csv"
+QUARANTINE_REASON_COLUMN = "QuarantineReason"
+PART_NUMBER_PATTERN = r"[A-Z0-9][A-Z0-9./\-]*"
+ASIN_PATTERN = r"[A-Z0-9]{10}"
+
+# Checkpointing and partitioned enrichment
+WORK_DIR = BASE_DIR / "work"
+ENRICH_CHUNK_SIZE = 50_000
+
+# Text column storage: "object" (numpy) or "pyarrow" (Arrow-backed string[pyarrow])
+STRING_STORAGE = "object"
+PYARROW_STRING_DTYPE = "string[pyarrow]"
+TEXT_COLUMNS = ["PartNumber", "ASIN", "Title", "URL", "Bullets"]
+LOAD_CHUNK_SIZE = 100_000
+
+# Memory governor (--max-memory): RSS fraction of the budget treated as pressure,
+# rows sampled to estimate bytes per row, peak bytes per byte of frame data while
+# a batch is processed, and the smallest batch size it shrinks to
+MEMORY_HIGH_WATER = 0.85
+MEMORY_SAMPLE_ROWS = 2_000
+MEMORY_WORK_FACTOR = 3.0
+MIN_WORK_ROWS = 1_000
+
+# Progress bars: minimum seconds between updates of one bar
+PROGRESS_MIN_INTERVAL = 0.5
+PROGRESS_VALUE_BATCH = 500  # distinct values normalized between progress reports
+
+# Normalization tracing
+TRACE_FILE = BASE_DIR / "normalization_trace.jsonl"
+
+# Enriched catalog store and export profiles
+CATALOG_DB_FILE = DATA_DIR / "catalog.sqlite"
+EXPORT_PROFILES = {
+    "amazon": {
+        "columns": ["PartNumber", "ASIN", "Title", MERGED_DESC_COLUMN, "URL"]
+        + [f"bullet{i+1:02d}" for i in range(MAX_BULLETS)],
+        "matched_only": False
+    },
+    "fitment": {
+        "columns": ["ASIN", MERGED_DESC_COLUMN],
+        "matched_only": True
+    },
+    "listing": {
+        "columns": ["ASIN", "Title"] + [f"bullet{i+1:02d}" for i in range(MAX_BULLETS)],
+        "matched_only": False
+    }
+}
@@ -0,0 +1,57 @@
+"""Export marketplace files from the enriched catalog store."""
+import argparse
+from typing import List, Optional
+from termcolor import cprint
+
+from config.settings import DATA_DIR, EXPORT_PROFILES
+from config.profiles import DEFAULT_PROFILE
+from config.loader import load_config, set_config
+from utils.logger import setup_logger
+from io_utils.catalog_store import CatalogStore
+from io_utils.file_writer import save_output
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Export enriched catalog rows")
+    parser.add_argument(
+        "--profile",
+        choices=sorted(EXPORT_PROFILES),
+        default="amazon",
+        help="Export profile (columns and filters) from settings.EXPORT_PROFILES"
+    )
+    parser.add_argument("--output", help="Output CSV (default: data/export_<profile>.csv)")
+    parser.add_argument("--asin", action="append", default=[], help="Only export this ASIN (repeatable)")
+    parser.add_argument(
+        "--run-profile",
+        default=DEFAULT_PROFILE.name,
+        help="Pipeline profile whose catalog store is exported (as passed to main.py --profile)"
+    )
+    parser.add_argument("--db", help="Catalog store to export from (overrides the run profile's catalog_db_file)")
+    parser.add_argument("--config", help="TOML/YAML run configuration (run profiles, output encoding and batch size)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Export one profile from the catalog store."""
+    args = parse_args(argv)
+    logger = setup_logger(__name__)
+    try:
+        config = load_config(args.config)
+        run_profile = config.profile(args.run_profile)
+    except ValueError as e:
+        cprint(f"❌ {e}", "red")
+        raise SystemExit(2)
+    set_config(config)
+    profile = EXPORT_PROFILES[args.profile]
+    output_file = args.output or DATA_DIR / f"export_{args.profile}.csv"
+
+    store = CatalogStore(args.db or run_profile.catalog_db_file)
+    df = store.export(profile["columns"], matched_only=profile["matched_only"], asins=args.asin)
+    save_output(df, output_file)
+    logger.info(f"Exported {len(df)} rows with profile '{args.profile}' to {output_file}.")
+    cprint(f"✅ Exported {len(df)} rows ({args.profile}) to {output_file}", "green")
+
+
+if __name__ == "__main__":
+    main()
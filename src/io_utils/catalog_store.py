@@ -0,0 +1,117 @@
+"""SQLite store of enriched catalog rows for repeated exports."""
+import sqlite3
+from contextlib import contextmanager
+from typing import List, Optional
+import pandas as pd
+from config.settings import MAX_BULLETS, MERGED_DESC_COLUMN
+
+TABLE_NAME = "catalog"
+ORDER_COLUMN = "row_order"
+
+# Columns kept in the store, in output order
+STORE_COLUMNS = ["PartNumber", "ASIN", "Title", MERGED_DESC_COLUMN, "URL"] + [
+    f"bullet{i+1:02d}" for i in range(MAX_BULLETS)
+]
+
+
+def _quote(column: str) -> str:
+    return '"' + column.replace('"', '""') + '"'
+
+
+class CatalogStore:
+    """Enriched catalog rows keyed by their position in the pipeline output.
+
+    PartNumber/ASIN pairs are indexed but not unique: a product matching
+    repeated vehicle keys yields one output row per vehicle entry, and every
+    one of them is kept.
+
+    The pipeline refreshes the store after each run; export profiles then
+    project and filter straight from it without touching the normalizers.
+    """
+
+    def __init__(self, db_path: str):
+        """Open (and create if needed) the store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = str(db_path)
+        with self._connect() as conn:
+            self._create_table(conn)
+
+    @staticmethod
+    def _create_table(conn: sqlite3.Connection):
+        columns = ", ".join(f"{_quote(col)} TEXT" for col in STORE_COLUMNS)
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {TABLE_NAME} ("
+            f"{columns}, {ORDER_COLUMN} INTEGER PRIMARY KEY)"
+        )
+        conn.execute(
+            f'CREATE INDEX IF NOT EXISTS {TABLE_NAME}_part_asin ON {TABLE_NAME} ("PartNumber", "ASIN")'
+        )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def replace_all(self, df: pd.DataFrame):
+        """Replace the stored catalog with the rows of an enriched DataFrame.
+
+        The table is recreated, so stores written with an older schema are
+        upgraded on the next run.
+
+        Args:
+            df: Final enriched DataFrame (missing store columns are stored as NULL)
+        """
+        rows = df.reindex(columns=STORE_COLUMNS).astype(object)
+        rows = rows.where(rows.notna(), None)
+        rows["ASIN"] = rows["ASIN"].where(rows["ASIN"].notna(), "")
+        rows[ORDER_COLUMN] = range(len(rows))
+        columns = STORE_COLUMNS + [ORDER_COLUMN]
+        placeholders = ", ".join("?" for _ in columns)
+        with self._connect() as conn:
+            conn.execute(f"DROP TABLE IF EXISTS {TABLE_NAME}")
+            self._create_table(conn)
+            conn.executemany(
+                f"INSERT INTO {TABLE_NAME} "
+                f"({', '.join(_quote(col) for col in columns)}) VALUES ({placeholders})",
+                rows.itertuples(index=False, name=None)
+            )
+
+    def count(self) -> int:
+        """Return the number of stored rows."""
+        with self._connect() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}").fetchone()[0]
+
+    def export(self, columns: List[str], matched_only: bool = False,
+               asins: Optional[List[str]] = None) -> pd.DataFrame:
+        """Project and filter stored rows in pipeline output order.
+
+        Args:
+            columns: Columns to export, in order
+            matched_only: Only rows with a vehicle fitment description
+            asins: Only rows with one of these ASINs
+
+        Returns:
+            DataFrame with the requested columns
+        """
+        unknown = [col for col in columns if col not in STORE_COLUMNS]
+        if unknown:
+            raise KeyError(f"Unknown export columns: {unknown}")
+        conditions, params = [], []
+        if matched_only:
+            conditions.append(f"{_quote(MERGED_DESC_COLUMN)} IS NOT NULL")
+        if asins:
+            conditions.append(f'"ASIN" IN ({", ".join("?" for _ in asins)})')
+            params.extend(asins)
+        query = f"SELECT {', '.join(_quote(col) for col in columns)} FROM {TABLE_NAME}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {ORDER_COLUMN}"
+        with self._connect() as conn:
+            return pd.read_sql_query(query, conn, params=params)
@@ -1,23 +1,167 @@
+import io
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional, Tuple
 import pandas as pd
-from config.settings import REQUIRED_COLUMNS
+from config.settings import REQUIRED_COLUMNS, TEXT_COLUMNS, MERGED_DESC_COLUMN
+from config.loader import get_config
 
-def load_product_data(file_path: str) -> pd.DataFrame:
-    df = pd.read_csv(
-        file_path,
-        encoding="utf-8",
-        engine="python",
-        quotechar='"',
-        skip_blank_lines=True
-    )
+READ_BUFFER_SIZE = 1 << 20
+
+class _LineCountingReader(io.RawIOBase):
+    """Raw file reader that reports the newlines in every block it hands out."""
+
+    def __init__(self, raw, on_lines: Callable[[int], None]):
+        self._raw = raw
+        self._on_lines = on_lines
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self._raw.readinto(buffer)
+        if n:
+            self._on_lines(memoryview(buffer)[:n].tobytes().count(b"\n"))
+        return n
+
+    def close(self):
+        self._raw.close()
+        super().close()
+
+@contextmanager
+def _open_csv(file_path: str, engine: str, on_rows: Optional[Callable[[int], None]]):
+    if on_rows is None:
+        yield file_path
+        return
+    reader = io.BufferedReader(_LineCountingReader(open(file_path, "rb"), on_rows), READ_BUFFER_SIZE)
+    # The pyarrow engine decodes itself; the others read text like pandas does for paths
+    handle = reader if engine == "pyarrow" else io.TextIOWrapper(reader, encoding="utf-8", newline="")
+    try:
+        yield handle
+    finally:
+        handle.close()
+
+def count_rows(file_path: str) -> int:
+    lines = 0
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(READ_BUFFER_SIZE), b""):
+            lines += block.count(b"\n")
+    return max(lines - 1, 0)
+
+def _to_string_dtype(df: pd.DataFrame, columns, string_dtype: Optional[str]) -> pd.DataFrame:
+    if string_dtype is None:
+        return df
+    present = [col for col in columns if col in df.columns]
+    return df.astype({col: string_dtype for col in present})
+
+def load_product_data(file_path: str, string_dtype: Optional[str] = None,
+                      on_rows: Optional[Callable[[int], None]] = None, chunked: bool = False) -> pd.DataFrame:
+    config = get_config()
+    with _open_csv(file_path, config.csv_engine, on_rows) as source:
+        df = _read_product_csv(source, string_dtype, config, chunked)
+    df = _check_product_columns(df)
+    return _to_string_dtype(df, TEXT_COLUMNS + [MERGED_DESC_COLUMN], string_dtype)
+
+def _read_product_csv(source, string_dtype: Optional[str], config, chunked: bool = False) -> pd.DataFrame:
+    if string_dtype is None and not chunked:
+        df = pd.read_csv(
+            source,
+            encoding="utf-8",
+            engine=config.csv_engine,
+            quotechar='"',
+            skip_blank_lines=True
+        )
+    elif config.csv_engine == "pyarrow" and not chunked:
+        # The pyarrow engine builds Arrow columns directly and does not chunk
+        df = pd.read_csv(
+            source,
+            encoding="utf-8",
+            engine="pyarrow",
+            quotechar='"',
+            skip_blank_lines=True,
+            dtype={col: string_dtype for col in TEXT_COLUMNS}
+        )
+    else:
+        # Parse in chunks so only one chunk of parser temporaries is alive at a time;
+        # text columns keep their type instead of being inferred chunk by chunk
+        chunks = pd.read_csv(
+            source,
+            encoding="utf-8",
+            engine="c" if config.csv_engine == "pyarrow" else config.csv_engine,
+            quotechar='"',
+            skip_blank_lines=True,
+            dtype={col: string_dtype or object for col in TEXT_COLUMNS},
+            chunksize=config.load_chunk_size
+        )
+        df = pd.concat(chunks, ignore_index=True)
+    return df
+
+def _check_product_columns(df: pd.DataFrame) -> pd.DataFrame:
     if not all(col in df.columns for col in ["PartNumber", "Title"]):
         df.columns = REQUIRED_COLUMNS[:len(df.columns)]
     if "PartNumber" not in df.columns or "Title" not in df.columns:
         raise KeyError("Missing required columns.")
     return df
 
-def load_vehicle_data(file_path: str) -> pd.DataFrame:
-    return pd.read_excel(file_path, header=None)
+def iter_product_data(file_path: str, string_dtype: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    config = get_config()
+    # The pyarrow engine cannot read in chunks
+    engine = "c" if config.csv_engine == "pyarrow" else config.csv_engine
+    chunks = pd.read_csv(
+        file_path,
+        encoding="utf-8",
+        engine=engine,
+        quotechar='"',
+        skip_blank_lines=True,
+        dtype={col: string_dtype for col in TEXT_COLUMNS} if string_dtype else None,
+        chunksize=config.load_chunk_size
+    )
+    for chunk in chunks:
+        chunk = _check_product_columns(chunk)
+        yield _to_string_dtype(chunk, TEXT_COLUMNS + [MERGED_DESC_COLUMN], string_dtype)
+
+def sample_product_data(file_path: str, rows: int, string_dtype: Optional[str] = None) -> pd.DataFrame:
+    config = get_config()
+    # The pyarrow engine does not support nrows
+    engine = "c" if config.csv_engine == "pyarrow" else config.csv_engine
+    df = pd.read_csv(file_path, encoding="utf-8", engine=engine, quotechar='"',
+                     skip_blank_lines=True, nrows=rows)
+    df = _check_product_columns(df)
+    return _to_string_dtype(df, TEXT_COLUMNS + [MERGED_DESC_COLUMN], string_dtype)
+
+def load_vehicle_data(file_path: str, string_dtype: Optional[str] = None) -> pd.DataFrame:
+    df = pd.read_excel(file_path, header=None, engine=get_config().excel_engine)
+    return _to_string_dtype(df, [0, 11], string_dtype)
+
+def iter_vehicle_rows(file_path: str) -> Iterator[Tuple[int, Any, Any]]:
+    # Streams with openpyxl in read-only mode whatever excel_engine is set to;
+    # pandas has no row-streaming Excel reader
+    from openpyxl import load_workbook
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        # Row 1 is the column header; yields (row number, part number, application)
+        rows = workbook.worksheets[0].iter_rows(min_row=2, values_only=True)
+        for row_number, row in enumerate(rows, start=2):
+            row = tuple(row) + (None,) * (12 - len(row))
+            yield row_number, row[0], row[11]
+    finally:
+        workbook.close()
+
+def sample_vehicle_data(file_path: str, rows: int, string_dtype: Optional[str] = None) -> Tuple[pd.DataFrame, int]:
+    # Reads only the first rows, with openpyxl in read-only mode whatever excel_engine is set to
+    from openpyxl import load_workbook
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        # Same layout as load_vehicle_data (header row included); returns (sample, sheet rows)
+        worksheet = workbook.worksheets[0]
+        values = worksheet.iter_rows(values_only=True)
+        sample = list(islice(values, rows))
+        total = worksheet.max_row if worksheet.max_row is not None else len(sample) + sum(1 for _ in values)
+    finally:
+        workbook.close()
+    df = pd.DataFrame(sample).infer_objects()
+    return _to_string_dtype(df, [0, 11], string_dtype), total
 
 def load_brand_mappings(mapping_file: str) -> dict:
     mapping_df = pd.read_csv(mapping_file, header=None)
-    return dict(zip(mapping_df[0].astype(str), mapping_df[1].astype(str))) 
\ No newline at end of file
+    return dict(zip(mapping_df[0].astype(str), mapping_df[1].astype(str)))
@@ -1,4 +1,187 @@
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
+from config.loader import get_config
 
-def save_output(df: pd.DataFrame, output_file: str):
-    df.to_csv(output_file, index=False) 
\ No newline at end of file
+# Rows per to_csv call when reporting progress and write_chunk_size is unset
+PROGRESS_WRITE_ROWS = 50_000
+# Rows encoded per worker task when sharding
+SHARD_PIECE_ROWS = 20_000
+
+def _write_csv(df: pd.DataFrame, path: str, on_rows: Optional[Callable[[int], None]] = None):
+    config = get_config()
+    if on_rows is None:
+        df.to_csv(path, index=False, encoding=config.output_encoding,
+                  chunksize=config.write_chunk_size or None)
+        return
+    # Write in slices so progress can be reported between them
+    batch_rows = config.write_chunk_size or PROGRESS_WRITE_ROWS
+    with open(path, "w", encoding=config.output_encoding, newline="") as f:
+        for start in range(0, max(len(df), 1), batch_rows):
+            batch = df.iloc[start:start + batch_rows]
+            batch.to_csv(f, index=False, header=start == 0)
+            on_rows(len(batch))
+
+def save_output(df: pd.DataFrame, output_file: str, on_rows: Optional[Callable[[int], None]] = None):
+    # The single file replaces a sharded output of a previous run
+    _remove_shards(output_file)
+    _write_csv(df, output_file, on_rows)
+
+def save_quarantine(df: pd.DataFrame, quarantine_file: str):
+    _write_csv(df, quarantine_file)
+
+def shard_path(output_file: str, index: int) -> Path:
+    output_file = Path(output_file)
+    return output_file.with_name(f"{output_file.stem}.part-{index:04d}{output_file.suffix}")
+
+def manifest_path(output_file: str) -> Path:
+    output_file = Path(output_file)
+    return output_file.with_name(f"{output_file.stem}.manifest.json")
+
+def _remove_shards(output_file: str):
+    """Delete the part files listed in the output's manifest, and the manifest."""
+    manifest_file = manifest_path(output_file)
+    if manifest_file.exists():
+        for shard in json.loads(manifest_file.read_text(encoding="utf-8")).get("shards", []):
+            manifest_file.with_name(shard["file"]).unlink(missing_ok=True)
+        manifest_file.unlink()
+
+def _encode_piece(piece: pd.DataFrame, encoding: str) -> Tuple[bytes, np.ndarray]:
+    """Encode rows without a header; also return the byte offset where each row ends."""
+    data = piece.to_csv(index=False, header=False, lineterminator="\n").encode(encoding)
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    # A newline ends a record unless it sits inside a quoted field (odd quote count so far)
+    quotes_before = np.searchsorted(np.flatnonzero(buffer == ord('"')), newlines)
+    row_ends = newlines[quotes_before % 2 == 0] + 1
+    if len(row_ends) != len(piece):
+        raise RuntimeError(f"Found {len(row_ends)} records in {len(piece)} encoded rows")
+    return data, row_ends
+
+def _encoded_pieces(df: pd.DataFrame, encoding: str, workers: int) -> Iterator[Tuple[bytes, np.ndarray]]:
+    """Encode the frame piece by piece, in row order, with a bounded number in flight."""
+    ranges = [(start, start + SHARD_PIECE_ROWS) for start in range(0, len(df), SHARD_PIECE_ROWS)]
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            yield _encode_piece(df.iloc[start:end], encoding)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, end in ranges:
+            pending.append(pool.submit(_encode_piece, df.iloc[start:end], encoding))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+class _ShardSink:
+    """Packs encoded rows into part files under the row and byte budgets."""
+
+    def __init__(self, output_file: str, header: bytes, max_rows: int, max_bytes: int):
+        if max_bytes and len(header) >= max_bytes:
+            raise ValueError(f"shard_max_bytes ({max_bytes}) does not fit the {len(header)}-byte header")
+        self.output_file = output_file
+        self.header = header
+        self.max_rows = max_rows or float("inf")
+        self.max_bytes = max_bytes or float("inf")
+        self.shards: List[dict] = []
+        self._file = None
+        self._rows_written = 0
+
+    def open_shard(self):
+        path = shard_path(self.output_file, len(self.shards) + 1)
+        self._file = open(path, "wb")
+        self._file.write(self.header)
+        self._digest = hashlib.sha256(self.header)
+        self.shards.append({
+            "file": path.name,
+            "row_start": self._rows_written,
+            "row_end": self._rows_written,
+            "rows": 0,
+            "bytes": len(self.header)
+        })
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self.shards[-1]["sha256"] = self._digest.hexdigest()
+            self._file = None
+
+    def write(self, data: bytes, row_ends: np.ndarray):
+        row, offset = 0, 0
+        while row < len(row_ends):
+            if self._file is None:
+                self.open_shard()
+            shard = self.shards[-1]
+            byte_room = self.max_bytes - shard["bytes"]
+            fit = int(np.searchsorted(row_ends[row:] - offset, byte_room, side="right"))
+            fit = int(min(fit, self.max_rows - shard["rows"]))
+            if fit == 0:
+                if shard["rows"] == 0:
+                    raise ValueError(f"Row {self._rows_written} does not fit in shard_max_bytes ({self.max_bytes})")
+                self.close()
+                continue
+            end = int(row_ends[row + fit - 1])
+            chunk = data[offset:end]
+            self._file.write(chunk)
+            self._digest.update(chunk)
+            shard["rows"] += fit
+            shard["bytes"] += len(chunk)
+            self._rows_written += fit
+            shard["row_end"] = self._rows_written
+            row, offset = row + fit, end
+
+def save_sharded_output(df: pd.DataFrame, output_file: str,
+                        on_rows: Optional[Callable[[int], None]] = None) -> dict:
+    """Write the output as part files within the configured row/byte budgets.
+
+    Pieces of the frame are CSV-encoded in parallel worker processes and packed,
+    in order, into ``<stem>.part-NNNN<suffix>`` files that each repeat the
+    header. A ``<stem>.manifest.json`` lists every shard with its row range
+    (``row_start`` inclusive, ``row_end`` exclusive, 0-based data rows), size
+    and sha256. Part files listed in a previous manifest, and an unsharded
+    ``output_file`` from a previous run, are removed first.
+
+    Args:
+        df: Final output DataFrame
+        output_file: Unsharded output path the part file names derive from
+        on_rows: Called with the number of rows after each encoded piece
+
+    Returns:
+        The manifest
+    """
+    config = get_config()
+    if "\n\"".encode(config.output_encoding) != b"\n\"":
+        raise ValueError(f"Sharding needs an ASCII-compatible output encoding, got {config.output_encoding}")
+    manifest_file = manifest_path(output_file)
+    _remove_shards(output_file)
+    Path(output_file).unlink(missing_ok=True)
+
+    header = df.iloc[:0].to_csv(index=False, lineterminator="\n").encode(config.output_encoding)
+    sink = _ShardSink(output_file, header, config.shard_max_rows, config.shard_max_bytes)
+    try:
+        for data, row_ends in _encoded_pieces(df, config.output_encoding, config.write_workers):
+            sink.write(data, row_ends)
+            if on_rows is not None:
+                on_rows(len(row_ends))
+        if not sink.shards:
+            # An empty output still gets one header-only part
+            sink.open_shard()
+    finally:
+        sink.close()
+
+    manifest = {
+        "output": Path(output_file).name,
+        "rows": len(df),
+        "encoding": config.output_encoding,
+        "max_rows": config.shard_max_rows,
+        "max_bytes": config.shard_max_bytes,
+        "shards": sink.shards
+    }
+    manifest_file.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
@@ -1,93 +1,510 @@
 """Main script for the product merge application."""
+import argparse
+import logging
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+import pandas as pd
 from rich.console import Console
 from rich.table import Table
-from yaspin import yaspin
 from termcolor import cprint
 
 from config.settings import (
-    INPUT_PRODUCT_FILE,
-    INPUT_VEHICLE_FILE,
-    BRAND_MAPPINGS_FILE,
-    OUTPUT_FILE,
-    REQUIRED_COLUMNS,
-    MERGED_DESC_COLUMN
+    MERGED_DESC_COLUMN,
+    QUARANTINE_REASON_COLUMN,
+    PYARROW_STRING_DTYPE,
+    MEMORY_SAMPLE_ROWS
 )
+from config.profiles import DEFAULT_PROFILE, PipelineProfile
+from config.loader import RunConfig, load_config, set_config
 from utils.logger import setup_logger
-from utils.data_cleaner import split_bullets
-from io_utils.file_loader import load_product_data, load_vehicle_data, load_brand_mappings
-from io_utils.file_writer import save_output
+from utils.data_cleaner import split_bullets, dedup_ratio, normalize_part_numbers
+from utils.checkpoint import CheckpointStore, fingerprint_inputs
+from utils.tracer import NormalizationTracer
+from utils.progress import PipelineProgress
+from utils.memory import MemoryGovernor, frame_row_bytes, format_bytes, parse_memory_size, peak_rss
+from io_utils.file_loader import (
+    count_rows,
+    load_product_data,
+    load_vehicle_data,
+    sample_product_data,
+    sample_vehicle_data,
+    iter_product_data,
+    iter_vehicle_rows
+)
+from io_utils.file_writer import save_output, save_quarantine, save_sharded_output, manifest_path
+from io_utils.catalog_store import CatalogStore
 from processors.product_enricher import enrich_product_data
-from processors.vehicle_matcher import merge_vehicle_data
+from processors.brand_expander import BrandExpander, load_brand_expander
+from processors.vehicle_matcher import merge_vehicle_data, merge_sorted_vehicle_data
+from processors.pipeline import select_output_columns
+from processors.row_validator import validate_product_rows, validate_enriched_rows, split_quarantine
 
-def main():
-    """Main execution function."""
-    logger = setup_logger(__name__)
-    console = Console()
-    
-    cprint("\n🚀 Starting Amazon Product Merge Tool\n", "cyan", attrs=["bold"])
-    logger.info("Started processing job.")
+def _memory_size(value: str) -> int:
+    try:
+        return parse_memory_size(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def _shard_limit(value: str) -> int:
+    try:
+        limit = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard limit {value!r} (expected a whole number)")
+    if limit < 0:
+        raise argparse.ArgumentTypeError(f"shard limit must be 0 (no limit) or positive, got {limit}")
+    return limit
 
+def _sample_fraction(value: str) -> float:
     try:
+        fraction = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid fraction {value!r} (expected a number from 0 to 1)")
+    if not 0.0 <= fraction <= 1.0:
+        raise argparse.ArgumentTypeError(f"fraction must be between 0 and 1, got {value}")
+    return fraction
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Amazon Product Merge Tool")
+    parser.add_argument(
+        "--config",
+        help="TOML/YAML file with tuning knobs and extra profiles "
+             "(default: $PRODUCT_MERGE_CONFIG, then product_merge.toml if present)"
+    )
+    parser.add_argument(
+        "--profile",
+        default=DEFAULT_PROFILE.name,
+        help="Run profile selecting inputs, normalization steps and output conventions "
+             "(built-in: default, legacy; more can be defined in the config file)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip stages and partitions already checkpointed for the same inputs"
+    )
+    parser.add_argument(
+        "--work-dir",
+        help="Directory for stage and partition checkpoints (overrides work_dir)"
+    )
+    parser.add_argument(
+        "--string-storage",
+        choices=["object", "pyarrow"],
+        help="Storage for text columns: numpy object or Arrow-backed string[pyarrow] "
+             "(overrides string_storage)"
+    )
+    parser.add_argument(
+        "--merge-strategy",
+        choices=["hash", "sorted"],
+        help="'sorted' streams inputs pre-sorted by part number through a merge join "
+             "and fails on out-of-order keys (overrides merge_strategy)"
+    )
+    parser.add_argument(
+        "--shard-rows",
+        type=_shard_limit,
+        help="Write the output as part files of at most this many rows; 0 = no row limit "
+             "(overrides shard_max_rows)"
+    )
+    parser.add_argument(
+        "--shard-bytes",
+        type=_shard_limit,
+        help="Write the output as part files of at most this many bytes; 0 = no byte limit "
+             "(overrides shard_max_bytes)"
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=_memory_size,
+        help="Memory budget, e.g. 4G or 512M: sizes batches to fit, spills enriched "
+             "partitions to disk and shrinks batches near the limit (overrides max_memory)"
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Disable progress bars (rows, rows/sec and ETA per stage)"
+    )
+    parser.add_argument(
+        "--trace-sample",
+        type=_sample_fraction,
+        default=0.0,
+        help="Fraction of rows (0-1) whose normalization steps are traced"
+    )
+    parser.add_argument(
+        "--trace-part",
+        action="append",
+        default=[],
+        help="PartNumber to trace (repeatable, or comma-separated)"
+    )
+    parser.add_argument(
+        "--trace-file",
+        help="JSONL file for normalization trace records (default: the profile's trace_file)"
+    )
+    return parser.parse_args(argv)
+
+def _validated_chunks(chunks: Iterable[pd.DataFrame], validate: bool,
+                      chunk_rows: List[int], quarantined: List[pd.DataFrame],
+                      on_rows: Callable[[int], None]) -> Iterator[pd.DataFrame]:
+    """Quarantine invalid rows chunk by chunk, recording chunk sizes and quarantined rows."""
+    for chunk in chunks:
+        chunk_rows.append(len(chunk))
+        on_rows(len(chunk))
+        if validate:
+            chunk, quarantined_chunk = split_quarantine(chunk, validate_product_rows(chunk))
+            quarantined.append(quarantined_chunk)
+        yield chunk
+
+def _plan_memory(governor: MemoryGovernor, store: CheckpointStore, config: RunConfig,
+                 profile: PipelineProfile, string_dtype: Optional[str],
+                 logger: logging.Logger) -> RunConfig:
+    """Size load chunks for the memory budget from a sample of the inputs.
+
+    Args:
+        governor: Enabled memory governor
+        store: Checkpoint store; a resumed merge needs no vehicle sheet estimate
+        config: Current run configuration
+        profile: Profile naming the input files
+        string_dtype: String dtype the inputs are loaded with
+        logger: Logger for the memory plan
+
+    Returns:
+        Run configuration with load_chunk_size fitted to the budget
+    """
+    # Chunk sizes do not change the output
+    product_rows = count_rows(profile.product_file)
+    row_bytes = frame_row_bytes(sample_product_data(profile.product_file, MEMORY_SAMPLE_ROWS, string_dtype))
+    config = replace(config, load_chunk_size=governor.chunk_rows(row_bytes, config.load_chunk_size))
+    logger.info(f"Memory budget {format_bytes(governor.max_bytes)}: ~{row_bytes:.0f} bytes per "
+                f"product row, {product_rows} rows, load chunks of {config.load_chunk_size} rows.")
+    input_bytes = product_rows * row_bytes
+    # The hash merge holds the whole vehicle sheet next to the products; the sorted merge streams it
+    if config.merge_strategy != "sorted" and not store.has_stage("merged"):
+        vehicle_sample, vehicle_rows = sample_vehicle_data(profile.vehicle_file, MEMORY_SAMPLE_ROWS, string_dtype)
+        vehicle_row_bytes = frame_row_bytes(vehicle_sample)
+        input_bytes += vehicle_rows * vehicle_row_bytes
+        logger.info(f"~{vehicle_row_bytes:.0f} bytes per vehicle row, {vehicle_rows} rows.")
+    headroom = governor.headroom()
+    if headroom is not None and input_bytes > headroom:
+        logger.warning(f"Input data alone needs ~{format_bytes(input_bytes)}, "
+                       f"more than the {format_bytes(headroom)} left in the memory budget.")
+    return config
+
+def _load_and_merge(store: CheckpointStore, config: RunConfig, profile: PipelineProfile,
+                    governor: MemoryGovernor, progress: PipelineProgress, string_dtype: Optional[str],
+                    logger: logging.Logger) -> Tuple[pd.DataFrame, pd.DataFrame, int]:
+    """Load, validate and merge the inputs, or resume the merged frame from its checkpoint.
+
+    Args:
+        store: Checkpoint store the merged frame is resumed from or saved to
+        config: Run configuration (merge strategy, load chunk size)
+        profile: Profile naming the input files
+        governor: Memory governor batching input validation
+        progress: Progress display
+        string_dtype: String dtype the inputs are loaded with
+        logger: Logger for the load and merge stages
+
+    Returns:
+        Merged frame, quarantined input rows and the number of product rows loaded
+    """
+    if store.has_stage("merged"):
+        df_merged = store.load_stage("merged")
+        quarantined_input = store.load_stage("quarantined_input")
+        cprint("⏩ Resumed merged product info from checkpoint", "cyan")
+        logger.info("Resumed merged product info from checkpoint.")
+        return df_merged, quarantined_input, store.stage_meta("merged")["rows_loaded"]
+
+    if config.merge_strategy == "sorted":
+        # Stream both inputs in part number order; one product chunk is held at a time
+        chunk_rows, quarantined_parts = [], []
+        total = count_rows(profile.product_file)
+        with progress.stage("Merging sorted inputs", total) as stage:
+            df_merged = merge_sorted_vehicle_data(
+                _validated_chunks(
+                    iter_product_data(profile.product_file, string_dtype),
+                    profile.validate_rows,
+                    chunk_rows,
+                    quarantined_parts,
+                    stage.advance
+                ),
+                iter_vehicle_rows(profile.vehicle_file)
+            )
+        rows_loaded = sum(chunk_rows)
+        quarantined_input = pd.concat(quarantined_parts, ignore_index=True) if quarantined_parts else pd.DataFrame()
+        logger.info(f"Sort-merged {rows_loaded} product rows in {len(chunk_rows)} chunks.")
+        if profile.validate_rows:
+            logger.info(f"Quarantined {len(quarantined_input)} invalid input rows.")
+    else:
         # Load product data
-        with yaspin(text="Loading product data...", color="cyan") as spinner:
-            df1 = load_product_data(INPUT_PRODUCT_FILE)
-            spinner.ok("✅")
+        with progress.stage("Loading product data", count_rows(profile.product_file)) as stage:
+            df1 = load_product_data(profile.product_file, string_dtype, on_rows=stage.advance,
+                                    chunked=governor.enabled)
+            stage.finish(len(df1))
             logger.info("Loaded file_001.csv successfully.")
+        rows_loaded = len(df1)
+
+        # Quarantine rows that fail cheap input checks
+        quarantined_input = pd.DataFrame()
+        if profile.validate_rows:
+            governor.size_batches(df1, config.load_chunk_size)
+            df1, quarantined_input = split_quarantine(df1, governor.map_batches(df1, validate_product_rows))
+            logger.info(f"Quarantined {len(quarantined_input)} invalid input rows.")
 
         # Load vehicle data
-        with yaspin(text="Loading vehicle data...", color="cyan") as spinner:
-            df2 = load_vehicle_data(INPUT_VEHICLE_FILE)
-            spinner.ok("✅")
+        with progress.stage("Loading vehicle data") as stage:
+            df2 = load_vehicle_data(profile.vehicle_file, string_dtype)
+            stage.finish(len(df2))
             logger.info("Loaded file_002.xlsx.")
 
         # Merge data
-        with yaspin(text="Merging product info...", color="cyan") as spinner:
+        with progress.stage("Merging product info", len(df1)) as stage:
             df_merged = merge_vehicle_data(df1, df2)
-            spinner.ok("✅")
+            stage.finish(len(df_merged))
             logger.info("Merged product info.")
+        # Only the merged frame is needed from here on
+        del df1, df2
+
+    store.save_stage("quarantined_input", quarantined_input)
+    store.save_stage("merged", df_merged, rows_loaded=rows_loaded)
+    return df_merged, quarantined_input, rows_loaded
+
+def _enrich_partitions(df_merged: pd.DataFrame, store: CheckpointStore, config: RunConfig,
+                       profile: PipelineProfile, governor: MemoryGovernor, progress: PipelineProgress,
+                       brand_mappings: BrandExpander, tracer: Optional[NormalizationTracer],
+                       logger: logging.Logger) -> List[Optional[pd.DataFrame]]:
+    """Enrich the merged frame partition by partition, checkpointing each one.
+
+    Args:
+        df_merged: Merged product frame
+        store: Checkpoint store holding finished partitions
+        config: Run configuration (enrichment chunk size)
+        profile: Profile whose normalization steps run
+        governor: Memory governor batching each partition
+        progress: Progress display
+        brand_mappings: Compiled brand mappings
+        tracer: Optional normalization tracer
+        logger: Logger for the enrichment stage
+
+    Returns:
+        Enriched partitions in order; all None once partitions spill to disk
+    """
+    enriched_parts = []
+    chunk_size = config.enrich_chunk_size
+    partitions = -(-len(df_merged) // chunk_size)
+    if governor.enabled:
+        governor.plan_enrichment(df_merged, chunk_size)
+        logger.info(f"Enriching in batches of {governor.work_rows or chunk_size} rows"
+                    f"{', spilling partitions to disk' if governor.spilling else ''}.")
+    with progress.stage("Enriching", len(df_merged)) as stage:
+        for index, start in enumerate(range(0, len(df_merged), chunk_size)):
+            stage.describe(f"Enriching partition {index + 1}/{partitions}")
+            if store.has_partition("enriched", index):
+                # Spilled partitions stay on disk until the merged frame is released
+                enriched_parts.append(None if governor.spilling else store.load_partition("enriched", index))
+                stage.advance(min(chunk_size, len(df_merged) - start))
+                continue
+            part = governor.map_batches(
+                df_merged.iloc[start:start + chunk_size],
+                lambda batch: enrich_product_data(batch.copy(), brand_mappings, tracer, profile.step_names,
+                                                  on_rows=stage.advance)
+            )
+            store.save_partition("enriched", index, part)
+            enriched_parts.append(part)
+            if governor.spilling:
+                enriched_parts = [None] * len(enriched_parts)
+            logger.info(f"Enriched partition {index} ({len(part)} rows).")
+        stage.describe(f"Enriched {partitions} partitions")
+    return enriched_parts
+
+def _quarantine_enriched(df_merged: pd.DataFrame, quarantined_input: pd.DataFrame, governor: MemoryGovernor,
+                         logger: logging.Logger) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Quarantine enriched rows whose descriptions could not be normalized.
+
+    Args:
+        df_merged: Enriched frame
+        quarantined_input: Input rows quarantined before the merge
+        governor: Memory governor batching the checks
+        logger: Logger for the quarantine count
+
+    Returns:
+        Frame without the quarantined rows, and every quarantined row with its reason
+    """
+    df_merged, quarantined_enriched = split_quarantine(
+        df_merged, governor.map_batches(df_merged, validate_enriched_rows)
+    )
+    logger.info(f"Quarantined {len(quarantined_enriched)} rows with unparsed descriptions.")
+    if "PartNumber" in quarantined_input.columns:
+        # Input rows are quarantined before the merge normalizes part numbers; record
+        # them in the output's form too (missing part numbers stay missing)
+        quarantined_input = normalize_part_numbers(quarantined_input).assign(
+            PartNumber=lambda df: df["PartNumber"].where(quarantined_input["PartNumber"].notna())
+        )
+    df_quarantine = pd.concat([quarantined_input, quarantined_enriched], ignore_index=True)
+    df_quarantine[QUARANTINE_REASON_COLUMN] = df_quarantine.pop(QUARANTINE_REASON_COLUMN)
+    return df_merged, df_quarantine
+
+def main(argv: Optional[List[str]] = None):
+    """Main execution function."""
+    args = parse_args(argv)
+    logger = setup_logger(__name__)
+    console = Console()
+
+    # Validate the run configuration once, before any work starts
+    try:
+        config = load_config(args.config)
+        profile = config.profile(args.profile)
+    except ValueError as e:
+        cprint(f"❌ {e}", "red")
+        raise SystemExit(2)
+    overrides = {}
+    if args.work_dir:
+        overrides["work_dir"] = Path(args.work_dir)
+    if args.string_storage:
+        overrides["string_storage"] = args.string_storage
+    if args.merge_strategy:
+        overrides["merge_strategy"] = args.merge_strategy
+    if args.shard_rows is not None:
+        overrides["shard_max_rows"] = args.shard_rows
+    if args.shard_bytes is not None:
+        overrides["shard_max_bytes"] = args.shard_bytes
+    if args.max_memory is not None:
+        overrides["max_memory"] = args.max_memory
+    config = replace(config, **overrides)
+    set_config(config)
+    
+    cprint("\n🚀 Starting Amazon Product Merge Tool\n", "cyan", attrs=["bold"])
+    logger.info("Started processing job.")
+
+    string_dtype = PYARROW_STRING_DTYPE if config.string_storage == "pyarrow" else None
+    trace_parts = [p for value in args.trace_part for p in value.split(",") if p.strip()]
+    tracer = None
+    if args.trace_sample > 0 or trace_parts:
+        tracer = NormalizationTracer(args.trace_file or profile.trace_file, args.trace_sample, trace_parts)
+    progress = PipelineProgress(enabled=not args.no_progress, console=console)
+    governor = MemoryGovernor(config.max_memory)
+
+    try:
+        # Compiled brand mappings; their version keys the checkpoints instead of the raw CSV
+        brand_mappings = load_brand_expander(profile.brand_mappings_file)
+        logger.info(f"Loaded {len(brand_mappings.pairs)} brand mappings (version {brand_mappings.version[:12]}).")
+
+        store = CheckpointStore(
+            config.work_dir,
+            fingerprint_inputs(
+                [profile.product_file, profile.vehicle_file],
+                profile=profile,
+                brand_mappings=brand_mappings.version,
+                chunk_size=config.enrich_chunk_size,
+                string_storage=config.string_storage,
+                csv_engine=config.csv_engine,
+                excel_engine=config.excel_engine
+            ),
+            resume=args.resume
+        )
+        if args.resume and not store.resumed:
+            logger.info("No matching checkpoints found; starting from scratch.")
+
+        if governor.enabled:
+            config = _plan_memory(governor, store, config, profile, string_dtype, logger)
+            set_config(config)
+        progress.start()
+
+        df_merged, quarantined_input, rows_loaded = _load_and_merge(
+            store, config, profile, governor, progress, string_dtype, logger
+        )
+
+        # Rows per distinct value; enrichment and bullet splitting run once per distinct value
+        dedup_ratios = {
+            "Title": dedup_ratio(df_merged["Title"]),
+            "Description": dedup_ratio(df_merged[MERGED_DESC_COLUMN]),
+            "Description/Title": dedup_ratio(df_merged[MERGED_DESC_COLUMN], df_merged["Title"])
+        }
+        if "Bullets" in df_merged.columns:
+            dedup_ratios["Bullets"] = dedup_ratio(df_merged["Bullets"])
+
+        # Enrich data partition by partition, checkpointing each one
+        enriched_parts = _enrich_partitions(df_merged, store, config, profile, governor, progress,
+                                            brand_mappings, tracer, logger)
+        if governor.spilling and enriched_parts:
+            # Release the merged frame before reading the enriched partitions back
+            df_merged = None
+            enriched_parts = [store.load_partition("enriched", index) for index in range(len(enriched_parts))]
+            logger.info(f"Read {len(enriched_parts)} spilled partitions back from {config.work_dir}.")
+        if enriched_parts:
+            df_merged = pd.concat(enriched_parts)
 
-        # Load brand mappings
-        brand_mappings = load_brand_mappings(BRAND_MAPPINGS_FILE)
-        
-        # Enrich data
-        df_merged = enrich_product_data(df_merged, brand_mappings)
-        
         # Split bullets
         if "Bullets" in df_merged.columns:
-            df_merged = split_bullets(df_merged)
+            df_merged = split_bullets(df_merged, column_format=profile.bullet_column_format)
             logger.info("Split Bullets into bullet columns.")
         else:
             logger.info("No 'Bullets' column found.")
 
-        # Move URL to last if exists
-        if "URL" in df_merged.columns:
-            url_col = df_merged.pop("URL")
-            df_merged["URL"] = url_col
-            logger.info("Moved URL to last column.")
-
-        # Define final column order
-        bullet_cols = [col for col in df_merged.columns if col.startswith("bullet")]
-        final_columns = [
-            "PartNumber",
-            "ASIN",
-            "Title",
-            MERGED_DESC_COLUMN,
-            "URL"
-        ] + bullet_cols
+        # Quarantine rows whose descriptions could not be normalized
+        df_quarantine = quarantined_input
+        if profile.validate_rows:
+            df_merged, df_quarantine = _quarantine_enriched(df_merged, quarantined_input, governor, logger)
+            save_quarantine(df_quarantine, profile.quarantine_file)
 
         # Save final output
-        df_final = df_merged[[col for col in final_columns if col in df_merged.columns]]
-        save_output(df_final, OUTPUT_FILE)
-        logger.info("Saved final output to file_001_updated.csv")
+        df_final = select_output_columns(df_merged, profile)
+        manifest = None
+        with progress.stage("Writing output", len(df_final)) as stage:
+            if config.shard_max_rows or config.shard_max_bytes:
+                manifest = save_sharded_output(df_final, profile.output_file, on_rows=stage.advance)
+            else:
+                save_output(df_final, profile.output_file, on_rows=stage.advance)
+        if manifest is not None:
+            logger.info(f"Saved final output as {len(manifest['shards'])} shards "
+                        f"listed in {manifest_path(profile.output_file).name}")
+        else:
+            logger.info(f"Saved final output to {profile.output_file.name}")
+
+        if governor.pressure_events:
+            logger.info(f"RSS crossed the memory high-water mark {governor.pressure_events} times"
+                        f"{f'; batches shrank to {governor.work_rows} rows' if governor.work_rows else ''}.")
+        if governor.enabled and (peak_rss() or 0) > governor.max_bytes:
+            # Bullet splitting and writing still work on the whole frame
+            logger.warning(f"Peak RSS {format_bytes(peak_rss())} exceeded the "
+                           f"{format_bytes(governor.max_bytes)} memory budget.")
+
+        # Refresh the enriched catalog store used by export profiles
+        if profile.store_catalog:
+            CatalogStore(profile.catalog_db_file).replace_all(df_final)
+            logger.info("Refreshed enriched catalog store.")
+
+        # Checkpoints only serve to resume an unfinished run
+        store.clear()
+
+        progress.stop()
 
         # Summary Table
         summary_table = Table(title="✅ Product Merge Summary", show_lines=True)
         summary_table.add_column("Metric", style="bold cyan")
         summary_table.add_column("Value", style="green")
-        summary_table.add_row("Rows processed", str(len(df1)))
+        summary_table.add_row("Rows processed", str(rows_loaded))
         summary_table.add_row("Rows merged", str(df_merged[MERGED_DESC_COLUMN].notna().sum()))
         summary_table.add_row("Unmatched rows", str(df_merged[MERGED_DESC_COLUMN].isna().sum()))
-        summary_table.add_row("Output file", str(OUTPUT_FILE))
+        summary_table.add_row("Quarantined rows", str(len(df_quarantine)))
+        for column, ratio in dedup_ratios.items():
+            summary_table.add_row(f"Dedup ratio ({column})", f"{ratio:.1f}x")
+        summary_table.add_row("Profile", profile.name)
+        summary_table.add_row("Brand mappings version", brand_mappings.version[:12])
+        if manifest is not None:
+            summary_table.add_row("Output shards", str(len(manifest["shards"])))
+            summary_table.add_row("Shard manifest", str(manifest_path(profile.output_file)))
+        else:
+            summary_table.add_row("Output file", str(profile.output_file))
+        if profile.validate_rows:
+            summary_table.add_row("Quarantine file", str(profile.quarantine_file))
+        if profile.store_catalog:
+            summary_table.add_row("Catalog store", str(profile.catalog_db_file))
+        if governor.enabled:
+            summary_table.add_row("Memory budget", format_bytes(governor.max_bytes))
+            if peak_rss() is not None:
+                summary_table.add_row("Peak RSS", format_bytes(peak_rss()))
+            summary_table.add_row("Partitions spilled", "yes" if governor.spilling else "no")
+            summary_table.add_row("Memory pressure events", str(governor.pressure_events))
+        if tracer is not None:
+            summary_table.add_row("Rows traced", str(tracer.rows_traced))
+            summary_table.add_row("Trace file", str(tracer.trace_file))
         console.print(summary_table)
 
         cprint("\n✅ All tasks completed successfully!\n", "green", attrs=["bold"])
@@ -96,6 +513,10 @@ def main():
     except Exception as e:
         logger.error(f"❌ Error: {str(e)}")
         raise e
+    finally:
+        progress.stop()
+        if tracer is not None:
+            tracer.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""Compiled, versioned brand abbreviation expansion.
+
+The mapping CSV is compiled once into a small JSON artifact next to it
+(``brand_abbreviations.compiled.json``) holding the ordered replacement pairs
+and a version hash. Runs load the artifact instead of parsing the CSV and
+recompile only when the CSV content changes.
+"""
+import csv
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+# Bump when the artifact layout or the expansion semantics change
+ARTIFACT_FORMAT = 1
+ARTIFACT_SUFFIX = ".compiled.json"
+HEADER_ROW = ("abbreviation", "brand")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass(frozen=True)
+class BrandExpander:
+    """Ordered abbreviation to brand replacements.
+
+    Replacements run sequentially in file order, each on the output of the
+    previous one, exactly like the original ``str.replace`` loop. Compiling only
+    drops entries that cannot change any text: the header row and identity
+    pairs such as ``BMW -> BMW``.
+    """
+
+    pairs: Tuple[Tuple[str, str], ...]
+    version: str
+    # sha256 of the CSV the pairs were compiled from, if any
+    source_sha256: str = ""
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, str]], source_sha256: str = "") -> "BrandExpander":
+        """Build an expander, dropping identity pairs and computing its version.
+
+        Later duplicates of an abbreviation replace its brand but keep its
+        first position, as a dict built from the rows would.
+        """
+        mapping = {}
+        for abbr, full in pairs:
+            mapping[abbr] = full
+        kept = tuple((abbr, full) for abbr, full in mapping.items() if abbr != full)
+        payload = json.dumps({"format": ARTIFACT_FORMAT, "pairs": kept}, ensure_ascii=False)
+        return cls(kept, _sha256(payload.encode("utf-8")), source_sha256)
+
+    def expand(self, text: str) -> str:
+        """Expand abbreviations in one description (non-strings pass through)."""
+        if not isinstance(text, str):
+            return text
+        for abbr, full in self.pairs:
+            if abbr in text:
+                text = text.replace(abbr, full)
+        return text
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "format": ARTIFACT_FORMAT,
+            "version": self.version,
+            "source_sha256": self.source_sha256,
+            "pairs": self.pairs
+        }, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text: str) -> Optional["BrandExpander"]:
+        """Load an artifact; returns None if it was written in another format."""
+        data = json.loads(text)
+        if data.get("format") != ARTIFACT_FORMAT:
+            return None
+        return cls(tuple(tuple(pair) for pair in data["pairs"]), data["version"], data["source_sha256"])
+
+
+def artifact_path(mapping_file: Union[str, Path]) -> Path:
+    """Return the compiled artifact path for a mapping CSV."""
+    mapping_file = Path(mapping_file)
+    return mapping_file.with_name(mapping_file.stem + ARTIFACT_SUFFIX)
+
+
+def compile_brand_mappings(mapping_file: Union[str, Path]) -> BrandExpander:
+    """Parse the mapping CSV into an expander.
+
+    Args:
+        mapping_file: CSV of abbreviation,brand rows, with or without a header
+
+    Returns:
+        BrandExpander whose ``source_sha256`` is the CSV's content hash
+    """
+    raw = Path(mapping_file).read_bytes()
+    rows = [row for row in csv.reader(raw.decode("utf-8-sig").splitlines()) if len(row) >= 2]
+    if rows and tuple(value.strip().lower() for value in rows[0][:2]) == HEADER_ROW:
+        rows = rows[1:]
+    return BrandExpander.from_pairs(((row[0], row[1]) for row in rows), _sha256(raw))
+
+
+def load_brand_expander(mapping_file: Union[str, Path]) -> BrandExpander:
+    """Load the compiled artifact for a mapping CSV, recompiling it if stale.
+
+    The artifact is reused while the CSV content hash matches the one it was
+    compiled from; otherwise the CSV is compiled and the artifact rewritten.
+
+    Args:
+        mapping_file: Brand abbreviation CSV
+
+    Returns:
+        BrandExpander
+    """
+    source_sha256 = _sha256(Path(mapping_file).read_bytes())
+    artifact = artifact_path(mapping_file)
+    if artifact.exists():
+        expander = BrandExpander.from_json(artifact.read_text(encoding="utf-8"))
+        if expander is not None and expander.source_sha256 == source_sha256:
+            return expander
+    expander = compile_brand_mappings(mapping_file)
+    try:
+        artifact.write_text(expander.to_json(), encoding="utf-8")
+    except OSError:
+        # A read-only data directory only costs recompiling on the next run
+        pass
+    return expander
@@ -1,5 +1,13 @@
-import re
 import pandas as pd
+from processors.patterns import (
+    MODEL_YEAR_BLOCK,
+    ALPHANUMERIC_CODE,
+    NUMERIC_PAREN,
+    SINGLE_YEAR_ENTRY,
+    ENTRY_GAP,
+    SINGLE_YEAR_NO_COMMA,
+    MULTI_SPACE
+)
 
 def prepend_vehicle_fit(text: str) -> str:
     if not isinstance(text, str):
@@ -16,8 +24,7 @@ def replace_abbrs(text: str, brand_mappings: dict) -> str:
 def normalize_model_year_blocks(text: str) -> str:
     if not isinstance(text, str):
         return text
-    pattern = re.compile(r'\((\d{2,4})-(\d{2,4})\)\s+([^*]+)')
-    matches = pattern.findall(text)
+    matches = MODEL_YEAR_BLOCK.findall(text)
     normalized_blocks = []
     for y1, y2, model in matches:
         y1, y2 = int(y1), int(y2)
@@ -33,7 +40,7 @@ def remove_trailing_star(text: str) -> str:
 def remove_alphanumeric_codes(text: str) -> str:
     if not isinstance(text, str):
         return text
-    return re.sub(r'\((?=[^)]*[A-Za-z])(?=[^)]*\d)[^)]*\)', '', text)
+    return ALPHANUMERIC_CODE.sub('', text)
 
 def remove_out_of_range_numeric_parens(text: str) -> str:
     if not isinstance(text, str):
@@ -45,7 +52,7 @@ def remove_out_of_range_numeric_parens(text: str) -> str:
             return ''
         return match.group(0)
     # Remove (number) and any following space if out of range
-    return re.sub(r'\((\d+)\)\s*', repl, text)
+    return NUMERIC_PAREN.sub(repl, text)
 
 def reformat_single_year_entries(text: str) -> str:
     if not isinstance(text, str):
@@ -57,9 +64,9 @@ def reformat_single_year_entries(text: str) -> str:
         model = match.group(2).strip()
         return f"{model} ({year})"
     # Replace all occurrences and add commas between entries
-    text = re.sub(r'\((19[5-9][0-9]|20[0-2][0-9]|2026)\)\s*([^,\(\)]+)', repl, text)
+    text = SINGLE_YEAR_ENTRY.sub(repl, text)
     # Remove extra spaces and ensure comma separation
-    text = re.sub(r'\)\s+(?=[A-Za-z])', '), ', text)
+    text = ENTRY_GAP.sub('), ', text)
     return text
 
 def format_single_year_entries_with_commas(text: str) -> str:
@@ -67,9 +74,9 @@ def format_single_year_entries_with_commas(text: str) -> str:
         return text
     # Insert a comma and space between consecutive single-year entries (e.g., ... (2006)BMW ... -> ... (2006), BMW ...)
     # Only match if the next entry starts with a capital letter (model name)
-    return re.sub(r'(\((19[5-9][0-9]|20[0-2][0-9]|2026)\))(?=[A-Z])', r'\1, ', text)
+    return SINGLE_YEAR_NO_COMMA.sub(r'\1, ', text)
 
 def sanitize_double_spaces(text: str) -> str:
     if not isinstance(text, str):
         return text
-    return re.sub(r'\s{2,}', ' ', text) 
\ No newline at end of file
+    return MULTI_SPACE.sub(' ', text) 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""Precompiled regular expressions for the description normalizers.
+
+Every pattern is compiled once at import time. Patterns are written so that
+adjacent quantifiers match disjoint character sets; a failed attempt therefore
+cannot backtrack into a neighbouring quantifier, and matching stays linear in
+the length of the description even for parts with thousands of fitments.
+"""
+import re
+
+# Years accepted as single-year entries (1950-2029)
+_SINGLE_YEAR = r'19[5-9][0-9]|20[0-2][0-9]'
+
+# (yy-yy) Model ... up to the next '*'. A single \s is enough: the model is
+# stripped, and one quantifier over whitespace cannot compete with [^*]+.
+MODEL_YEAR_BLOCK = re.compile(r'\((\d{2,4})-(\d{2,4})\)\s([^*]+)')
+
+# (...) containing at least one letter and one digit. Equivalent to
+# \((?=[^)]*[A-Za-z])(?=[^)]*\d)[^)]*\) without re-scanning the group twice.
+ALPHANUMERIC_CODE = re.compile(
+    r'\([^)A-Za-z\d]*(?:[A-Za-z][^)\d]*\d|\d[^)A-Za-z]*[A-Za-z])[^)]*\)'
+)
+
+# (digits) and any following whitespace
+NUMERIC_PAREN = re.compile(r'\((\d+)\)\s*')
+
+# (year) ModelName; leading whitespace stays in the model group and is stripped
+SINGLE_YEAR_ENTRY = re.compile(rf'\(({_SINGLE_YEAR})\)([^,()]+)')
+
+# Whitespace between a closing paren and the next model name
+ENTRY_GAP = re.compile(r'\)\s+(?=[A-Za-z])')
+
+# (year) immediately followed by the next model name
+SINGLE_YEAR_NO_COMMA = re.compile(rf'(\(({_SINGLE_YEAR})\))(?=[A-Z])')
+
+# Runs of two or more whitespace characters
+MULTI_SPACE = re.compile(r'\s{2,}')
+
+# A (yyyy-yyyy) range preceded by whitespace; used to bound TITLE_VEHICLE_RANGE
+YEAR_RANGE = re.compile(r'\s+\((\d{4})-(\d{4})\)')
+
+# Model (yyyy-yyyy) entries used to enrich titles. The lazy model group scans
+# to the end of the text when no range follows, so callers must limit matching
+# to the end of the last YEAR_RANGE match.
+TITLE_VEHICLE_RANGE = re.compile(r'(.+?)\s+\((\d{4})-(\d{4})\)')
@@ -0,0 +1,50 @@
+"""Profile-driven transformation engine shared by all entrypoints."""
+from typing import Union
+import pandas as pd
+from config.profiles import PipelineProfile
+from config.settings import MERGED_DESC_COLUMN
+from processors.brand_expander import BrandExpander
+from processors.product_enricher import enrich_product_data
+from processors.vehicle_matcher import merge_vehicle_data
+from utils.data_cleaner import split_bullets
+
+
+def select_output_columns(df: pd.DataFrame, profile: PipelineProfile) -> pd.DataFrame:
+    """Order and select the marketplace output columns.
+
+    Args:
+        df: Enriched DataFrame with bullet columns
+        profile: Profile whose bullet column naming is used
+
+    Returns:
+        DataFrame with PartNumber, ASIN, Title, description, URL and bullet columns
+    """
+    bullet_prefix = profile.bullet_column_format.split("{", 1)[0]
+    bullet_cols = [col for col in df.columns if str(col).startswith(bullet_prefix)]
+    final_columns = [
+        "PartNumber",
+        "ASIN",
+        "Title",
+        MERGED_DESC_COLUMN,
+        "URL"
+    ] + bullet_cols
+    return df[[col for col in final_columns if col in df.columns]]
+
+
+def transform(product_df: pd.DataFrame, vehicle_df: pd.DataFrame,
+              brand_mappings: Union[dict, BrandExpander], profile: PipelineProfile) -> pd.DataFrame:
+    """Run a profile's transformations in memory, without checkpoints or validation.
+
+    Args:
+        product_df: Product data as returned by ``load_product_data``
+        vehicle_df: Vehicle data as returned by ``load_vehicle_data``
+        brand_mappings: Compiled expander or abbreviation to brand name mapping
+        profile: Profile selecting steps and output conventions
+
+    Returns:
+        Final output DataFrame
+    """
+    df = merge_vehicle_data(product_df, vehicle_df)
+    df = enrich_product_data(df, brand_mappings, step_names=profile.step_names)
+    df = split_bullets(df, column_format=profile.bullet_column_format)
+    return select_output_columns(df, profile)
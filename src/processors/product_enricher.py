@@ -1,6 +1,7 @@
 """Product data enrichment functionality."""
-import re
-from typing import Dict, Optional
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
 import pandas as pd
 from processors.description_normalizer import (
     prepend_vehicle_fit,
@@ -13,33 +14,109 @@ from processors.description_normalizer import (
     format_single_year_entries_with_commas,
     sanitize_double_spaces
 )
+from processors.patterns import YEAR_RANGE, TITLE_VEHICLE_RANGE
 from config.settings import MERGED_DESC_COLUMN
 from io_utils.file_loader import load_brand_mappings
-from utils.data_cleaner import clean_title
-
-def enrich_product_data(df: pd.DataFrame, brand_mappings: dict) -> pd.DataFrame:
-    df["Title"] = df["Title"].apply(clean_title)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(prepend_vehicle_fit)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(lambda x: replace_abbrs(x, brand_mappings))
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(normalize_model_year_blocks)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(remove_trailing_star)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(remove_alphanumeric_codes)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(remove_out_of_range_numeric_parens)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(reformat_single_year_entries)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(format_single_year_entries_with_commas)
-    df[MERGED_DESC_COLUMN] = df[MERGED_DESC_COLUMN].apply(sanitize_double_spaces)
-
-    def enrich_title(row):
-        title = row["Title"]
-        desc = row[MERGED_DESC_COLUMN]
-        if not isinstance(title, str) or not isinstance(desc, str):
-            return title
-        desc_clean = desc.replace("VEHICLE FIT:", "").strip()
-        matches = re.findall(r'(.+?)\s+\((\d{4})-(\d{4})\)', desc_clean)
-        if len(matches) == 1:
-            model, y1, y2 = matches[0]
-            vehicle_info = f"{y1}-{y2} {model.strip()}"
-            return title.replace("For", f"For {vehicle_info}")
+from utils.data_cleaner import clean_title, apply_unique
+from utils.tracer import NormalizationTracer
+from processors.brand_expander import BrandExpander
+
+# Description normalization steps in pipeline order
+NORMALIZATION_STEP_NAMES = (
+    "prepend_vehicle_fit",
+    "replace_abbrs",
+    "normalize_model_year_blocks",
+    "remove_trailing_star",
+    "remove_alphanumeric_codes",
+    "remove_out_of_range_numeric_parens",
+    "reformat_single_year_entries",
+    "format_single_year_entries_with_commas",
+    "sanitize_double_spaces"
+)
+
+def build_normalization_steps(brand_mappings: Union[dict, BrandExpander],
+                              step_names: Optional[Sequence[str]] = None) -> List[Tuple[str, Callable]]:
+    """Return the ordered (name, function) description normalization steps.
+
+    Args:
+        brand_mappings: Compiled expander, or abbreviation to brand name dict, for ``replace_abbrs``
+        step_names: Steps to run, in order. If None, runs all steps
+
+    Returns:
+        List of (step name, function) pairs
+    """
+    available = {
+        "prepend_vehicle_fit": prepend_vehicle_fit,
+        "replace_abbrs": (
+            brand_mappings.expand if isinstance(brand_mappings, BrandExpander)
+            else partial(replace_abbrs, brand_mappings=brand_mappings)
+        ),
+        "normalize_model_year_blocks": normalize_model_year_blocks,
+        "remove_trailing_star": remove_trailing_star,
+        "remove_alphanumeric_codes": remove_alphanumeric_codes,
+        "remove_out_of_range_numeric_parens": remove_out_of_range_numeric_parens,
+        "reformat_single_year_entries": reformat_single_year_entries,
+        "format_single_year_entries_with_commas": format_single_year_entries_with_commas,
+        "sanitize_double_spaces": sanitize_double_spaces
+    }
+    step_names = NORMALIZATION_STEP_NAMES if step_names is None else step_names
+    unknown = [name for name in step_names if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown normalization steps: {unknown}")
+    return [(name, available[name]) for name in step_names]
+
+def enrich_title(title: str, desc: str) -> str:
+    """Add the vehicle to the title when the description fits exactly one range."""
+    if not isinstance(title, str) or not isinstance(desc, str):
+        return title
+    desc_clean = desc.replace("VEHICLE FIT:", "").strip()
+    # Nothing can match past the last year range; bounding the search there keeps
+    # the lazy model group from rescanning the tail from every position
+    last_range = None
+    for last_range in YEAR_RANGE.finditer(desc_clean):
+        pass
+    if last_range is None:
         return title
-    df["Title"] = df.apply(enrich_title, axis=1)
+    matches = TITLE_VEHICLE_RANGE.findall(desc_clean, 0, last_range.end())
+    if len(matches) == 1:
+        model, y1, y2 = matches[0]
+        vehicle_info = f"{y1}-{y2} {model.strip()}"
+        return title.replace("For", f"For {vehicle_info}")
+    return title
+
+def enrich_product_data(df: pd.DataFrame, brand_mappings: Union[dict, BrandExpander],
+                        tracer: Optional[NormalizationTracer] = None,
+                        step_names: Optional[Sequence[str]] = None,
+                        on_rows: Optional[Callable[[int], None]] = None) -> pd.DataFrame:
+    # Element-wise steps produce object columns; restore string dtypes at the end
+    string_dtypes = {
+        col: df[col].dtype
+        for col in ["Title", MERGED_DESC_COLUMN]
+        if isinstance(df[col].dtype, pd.StringDtype)
+    }
+    df["Title"] = apply_unique(df["Title"], clean_title)
+    steps = build_normalization_steps(brand_mappings, step_names)
+    if tracer is not None:
+        tracer.trace_steps(df, MERGED_DESC_COLUMN, steps)
+
+    # Run the whole step chain once per distinct description; this is the slow
+    # part, so progress is reported from it
+    def normalize(text):
+        for _, step in steps:
+            text = step(text)
+        return text
+    df[MERGED_DESC_COLUMN] = apply_unique(df[MERGED_DESC_COLUMN], normalize, on_rows)
+
+    # Enrich titles once per distinct (title, description) pair
+    title_codes, titles = pd.factorize(df["Title"], use_na_sentinel=False)
+    desc_codes, descs = pd.factorize(df[MERGED_DESC_COLUMN], use_na_sentinel=False)
+    pair_codes, pairs = pd.factorize(title_codes.astype(np.int64) * len(descs) + desc_codes)
+    enriched = np.empty(len(pairs), dtype=object)
+    enriched[:] = [
+        enrich_title(titles[pair // len(descs)], descs[pair % len(descs)])
+        for pair in pairs
+    ]
+    df["Title"] = pd.Series(enriched[pair_codes], index=df.index)
+    if string_dtypes:
+        df = df.astype(string_dtypes)
     return df 
\ No newline at end of file
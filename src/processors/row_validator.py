@@ -0,0 +1,99 @@
+"""Row-level validation and quarantine for product data."""
+from typing import Dict, Tuple
+import pandas as pd
+from config.settings import (
+    MAX_BULLETS,
+    MERGED_DESC_COLUMN,
+    VEHICLE_FIT_PREFIX,
+    QUARANTINE_REASON_COLUMN,
+    PART_NUMBER_PATTERN,
+    ASIN_PATTERN
+)
+
+# Reason codes written to the quarantine file
+INVALID_PART_NUMBER = "INVALID_PART_NUMBER"
+INVALID_ASIN = "INVALID_ASIN"
+DESCRIPTION_UNPARSED = "DESCRIPTION_UNPARSED"
+TOO_MANY_BULLETS = "TOO_MANY_BULLETS"
+
+# A parsed description keeps the prefix and has at least one (year) or (year-year) entry
+PARSED_DESCRIPTION_PATTERN = rf"{VEHICLE_FIT_PREFIX}.*\(\d{{4}}(?:-\d{{4}})?\)"
+
+
+def _invalid_pattern(series: pd.Series, pattern: str) -> pd.Series:
+    """Flag missing values and values that do not fully match a pattern."""
+    normalized = series.astype(str).str.strip().str.upper()
+    return series.isna() | ~normalized.str.fullmatch(pattern)
+
+
+def count_bullets(series: pd.Series, separator: str = "@") -> pd.Series:
+    """Count bullet points per row the same way ``split_bullets`` splits them.
+
+    Args:
+        series: Raw bullet text
+        separator: Character used to separate bullets
+
+    Returns:
+        Series with the number of bullets per row (0 for missing values)
+    """
+    text = series.astype(str).str.replace(" | ", separator, regex=False)
+    return (text.str.count(separator) + 1).where(series.notna(), 0)
+
+
+def _reason_codes(checks: Dict[str, pd.Series], index: pd.Index) -> pd.Series:
+    """Combine boolean failure masks into ';'-separated reason codes."""
+    reasons = pd.Series("", index=index, dtype=object)
+    for code, failed in checks.items():
+        failed = failed.fillna(False).astype(bool)
+        reasons = reasons.where(~failed, reasons + code + ";")
+    return reasons.str.rstrip(";")
+
+
+def validate_product_rows(df: pd.DataFrame, max_bullets: int = MAX_BULLETS) -> pd.Series:
+    """Check raw product rows before they are merged and enriched.
+
+    Args:
+        df: Product DataFrame as returned by ``load_product_data``
+        max_bullets: Maximum number of bullet columns the output supports
+
+    Returns:
+        Series of reason codes per row, empty string for valid rows
+    """
+    checks = {INVALID_PART_NUMBER: _invalid_pattern(df["PartNumber"], PART_NUMBER_PATTERN)}
+    if "ASIN" in df.columns:
+        checks[INVALID_ASIN] = _invalid_pattern(df["ASIN"], ASIN_PATTERN)
+    if "Bullets" in df.columns:
+        checks[TOO_MANY_BULLETS] = count_bullets(df["Bullets"]) > max_bullets
+    return _reason_codes(checks, df.index)
+
+
+def validate_enriched_rows(df: pd.DataFrame) -> pd.Series:
+    """Check enriched rows for descriptions the normalizers could not parse.
+
+    Unmatched rows (no description) are valid; they are reported separately.
+
+    Args:
+        df: Enriched DataFrame
+
+    Returns:
+        Series of reason codes per row, empty string for valid rows
+    """
+    desc = df[MERGED_DESC_COLUMN]
+    parsed = desc.astype(str).str.match(PARSED_DESCRIPTION_PATTERN)
+    checks = {DESCRIPTION_UNPARSED: desc.notna() & ~parsed}
+    return _reason_codes(checks, df.index)
+
+
+def split_quarantine(df: pd.DataFrame, reasons: pd.Series) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Split a DataFrame into valid rows and quarantined rows.
+
+    Args:
+        df: Input DataFrame
+        reasons: Reason codes per row as returned by the validators
+
+    Returns:
+        Tuple of (valid rows, quarantined rows with a reason column)
+    """
+    bad = reasons != ""
+    quarantined = df[bad].assign(**{QUARANTINE_REASON_COLUMN: reasons[bad]})
+    return df[~bad].copy(), quarantined
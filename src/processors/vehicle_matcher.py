@@ -1,33 +1,65 @@
 """Vehicle compatibility matching functionality."""
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-from utils.data_cleaner import normalize_part_numbers
+from utils.data_cleaner import normalize_part_numbers, as_text
 from utils.logger import setup_logger
 from io_utils.file_loader import load_product_data, load_vehicle_data
 
 logger = setup_logger(__name__)
 
+# Out-of-order keys quoted in the sorted merge error, per input
+MAX_REPORTED_KEYS = 10
+
+def _is_arrow_string(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.StringDtype) and series.dtype.storage == "pyarrow"
+
+def _lookup_indexer(lookup_keys: pd.Series, keys: pd.Series) -> np.ndarray:
+    """Positions of lookup_keys in the unique keys, -1 where missing."""
+    if _is_arrow_string(lookup_keys) and _is_arrow_string(keys):
+        # Hash in Arrow instead of materializing Python str objects for an Index
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        positions = pc.index_in(pa.array(lookup_keys.array), value_set=pa.array(keys.array))
+        return pc.fill_null(positions, -1).to_numpy()
+    return pd.Index(keys).get_indexer(lookup_keys)
+
 def merge_vehicle_data(product_df: pd.DataFrame, vehicle_df: pd.DataFrame) -> pd.DataFrame:
     """Merge product and vehicle data."""
     # Normalize merge keys
     product_df = normalize_part_numbers(product_df)
-    vehicle_df[0] = vehicle_df[0].astype(str).str.strip().str.upper()
+    vehicle_df[0] = as_text(vehicle_df[0]).str.strip().str.upper()
     
-    # Merge data
-    df_merged = pd.merge(
-        product_df,
-        vehicle_df[[0, 11]],
-        left_on="PartNumber",
-        right_on=0,
-        how='left'
-    )
-    
-    # Rename merged description column
-    df_merged.rename(columns={11: "Merged Description"}, inplace=True)
+    # Merge data; with unique vehicle keys a left join is a lookup, which avoids
+    # copying every product column into a new frame
+    if vehicle_df[0].is_unique:
+        indexer = _lookup_indexer(product_df["PartNumber"], vehicle_df[0])
+        df_merged = product_df.reset_index(drop=True)
+        df_merged["Merged Description"] = vehicle_df[11].array.take(indexer, allow_fill=True)
+    else:
+        df_merged = pd.merge(
+            product_df,
+            vehicle_df[[0, 11]],
+            left_on="PartNumber",
+            right_on=0,
+            how='left'
+        )
+
+        # Rename merged description column
+        df_merged.rename(columns={11: "Merged Description"}, inplace=True)
     
+    return _finish_merge(df_merged)
+
+def _finish_merge(df_merged: pd.DataFrame) -> pd.DataFrame:
+    """Prefix matched descriptions, report unmatched rows and drop the merge key."""
     # Add VEHICLE FIT: prefix if not present
+    desc_dtype = df_merged["Merged Description"].dtype
     df_merged["Merged Description"] = df_merged["Merged Description"].apply(
         lambda x: f"VEHICLE FIT: {x.strip()}" if isinstance(x, str) and not str(x).startswith("VEHICLE FIT:") else x
     )
+    if isinstance(desc_dtype, pd.StringDtype):
+        df_merged["Merged Description"] = df_merged["Merged Description"].astype(desc_dtype)
     
     # Log unmatched products
     unmatched = df_merged["Merged Description"].isna().sum()
@@ -38,4 +70,155 @@ def merge_vehicle_data(product_df: pd.DataFrame, vehicle_df: pd.DataFrame) -> pd
     if 0 in df_merged.columns:
         df_merged.drop(columns=[0], inplace=True)
     
-    return df_merged 
\ No newline at end of file
+    return df_merged
+
+class UnsortedInputError(ValueError):
+    """Raised when a sorted merge finds keys out of order in either input."""
+
+    def __init__(self, report: "SortOrderReport"):
+        super().__init__(report.describe())
+        self.report = report
+
+@dataclass
+class SortOrderReport:
+    """Out-of-order keys found while walking sorted inputs."""
+
+    product_rows: int = 0
+    vehicle_rows: int = 0
+    examples: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.product_rows == 0 and self.vehicle_rows == 0
+
+    def record(self, source: str, row: int, key: str, previous_key: str):
+        """Count an out-of-order key; ``row`` is its 1-based data row (header excluded)."""
+        if source == "product":
+            self.product_rows += 1
+            count = self.product_rows
+        else:
+            self.vehicle_rows += 1
+            count = self.vehicle_rows
+        if count <= MAX_REPORTED_KEYS:
+            self.examples.append(f"{source} row {row}: '{key}' after '{previous_key}'")
+
+    def describe(self) -> str:
+        lines = [
+            f"Sorted merge found {self.product_rows} product and {self.vehicle_rows} "
+            f"vehicle rows out of part number order (data rows, counted from 1 below the header):"
+        ] + [f"  {example}" for example in self.examples]
+        return "\n".join(lines)
+
+class _SortedVehicleStream:
+    """Vehicle (key, description) rows consumed in key order, one key range at a time."""
+
+    def __init__(self, rows: Iterable[Tuple[int, Any, Any]], report: SortOrderReport):
+        self._rows = iter(rows)
+        self._report = report
+        self._last_key = ""
+        self._pending = self._next()
+        # Rows for the last key of the previous range; the next product chunk may repeat it
+        self._carry: List[Tuple[str, Any]] = []
+
+    def _next(self) -> Optional[Tuple[str, Any]]:
+        for row_number, key, description in self._rows:
+            if key is None:
+                continue
+            key = str(key).strip().upper()
+            if key < self._last_key:
+                # Products with this key may already be behind us; skip and report it.
+                # Sheet row 2 is data row 1
+                self._report.record("vehicle", row_number - 1, key, self._last_key)
+                continue
+            self._last_key = key
+            return key, np.nan if description is None else description
+        return None
+
+    def through(self, max_key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return sorted keys and descriptions of all rows with keys up to ``max_key``."""
+        batch = self._carry
+        while self._pending is not None and self._pending[0] <= max_key:
+            batch.append(self._pending)
+            self._pending = self._next()
+        self._carry = [row for row in batch if row[0] == max_key]
+        keys = np.array([row[0] for row in batch], dtype=object)
+        descriptions = np.array([row[1] for row in batch], dtype=object)
+        return keys, descriptions
+
+    def drain(self):
+        """Consume the remaining rows so their ordering is checked too."""
+        while self._pending is not None:
+            self._pending = self._next()
+
+def _join_sorted_chunk(chunk: pd.DataFrame, keys: np.ndarray, missing: np.ndarray,
+                       vehicle_keys: np.ndarray, descriptions: np.ndarray) -> pd.DataFrame:
+    """Left-join one product chunk to a sorted vehicle batch, keeping duplicates like pd.merge."""
+    lo = np.searchsorted(vehicle_keys, keys, side="left")
+    hi = np.searchsorted(vehicle_keys, keys, side="right")
+    counts = np.where(missing, 0, hi - lo)
+    repeats = np.maximum(counts, 1)
+    left = np.repeat(np.arange(len(chunk)), repeats)
+    offsets = np.arange(repeats.sum()) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+    right = np.where(np.repeat(counts > 0, repeats), np.repeat(lo, repeats) + offsets, -1)
+
+    joined = chunk.iloc[left]
+    merged_desc = pd.array(descriptions, dtype=object).take(right, allow_fill=True)
+    joined = joined.assign(**{"Merged Description": merged_desc})
+    if _is_arrow_string(chunk["PartNumber"]):
+        joined["Merged Description"] = joined["Merged Description"].astype(chunk["PartNumber"].dtype)
+    return joined
+
+def merge_sorted_vehicle_data(product_chunks: Iterable[pd.DataFrame],
+                              vehicle_rows: Iterable[Tuple[int, Any, Any]]) -> pd.DataFrame:
+    """Merge product and vehicle data that are both sorted by part number.
+
+    Walks product chunks and vehicle rows together in key order, so only one
+    product chunk and the vehicle rows in its key range are held at a time; no
+    hash table over the vehicle data is built. Produces the same rows as
+    ``merge_vehicle_data`` on sorted inputs.
+
+    Args:
+        product_chunks: Product DataFrames in file order (e.g. ``iter_product_data``);
+            an empty feed must still yield one empty chunk with its columns
+        vehicle_rows: (row number, part number, application) tuples in file
+            order (e.g. ``iter_vehicle_rows``)
+
+    Returns:
+        Merged DataFrame
+
+    Raises:
+        UnsortedInputError: After both inputs are consumed, if any key in either
+            input was out of order (the join would silently miss matches)
+    """
+    report = SortOrderReport()
+    vehicles = _SortedVehicleStream(vehicle_rows, report)
+    previous_max = ""
+    merged = []
+    empty_chunk = None
+    for chunk in product_chunks:
+        chunk = normalize_part_numbers(chunk)
+        if chunk.empty:
+            # Kept so an empty or fully quarantined feed still yields the product columns
+            empty_chunk = chunk
+            continue
+        missing = chunk["PartNumber"].isna().to_numpy()
+        keys = chunk["PartNumber"].to_numpy(dtype=object, na_value="")
+        running_max = np.maximum.accumulate(np.concatenate([[previous_max], keys]))
+        for position in np.flatnonzero(~missing & (keys < running_max[:-1])):
+            # The chunk index counts data rows from 0 across chunks
+            report.record("product", int(chunk.index[position]) + 1, keys[position], running_max[position])
+        previous_max = running_max[-1]
+
+        vehicle_keys, descriptions = vehicles.through(previous_max)
+        merged.append(_join_sorted_chunk(chunk, keys, missing, vehicle_keys, descriptions))
+    vehicles.drain()
+
+    if not report.ok:
+        logger.error(report.describe())
+        raise UnsortedInputError(report)
+    if not merged:
+        if empty_chunk is None:
+            raise ValueError("Sorted merge got no product chunks, not even an empty one")
+        no_rows = np.array([], dtype=object)
+        merged.append(_join_sorted_chunk(empty_chunk, no_rows, np.array([], dtype=bool), no_rows, no_rows))
+    return _finish_merge(pd.concat(merged, ignore_index=True))
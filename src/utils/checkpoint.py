@@ -0,0 +1,148 @@
+"""Stage and partition checkpoints for resuming long-running jobs."""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import pandas as pd
+
+MANIFEST_NAME = "manifest.json"
+CHECKPOINT_SUFFIX = ".pkl"
+# File names this store writes (plus a ".tmp" suffix while a write is in flight)
+CHECKPOINT_PATTERNS = (f"stage-*{CHECKPOINT_SUFFIX}", f"*-part-[0-9][0-9][0-9][0-9][0-9]{CHECKPOINT_SUFFIX}")
+
+
+def fingerprint_inputs(paths: Iterable[str], **params: Any) -> str:
+    """Build a fingerprint of the input files and the run parameters.
+
+    Args:
+        paths: Input files whose content the checkpoints depend on
+        **params: Extra parameters that change checkpoint contents (e.g. chunk size)
+
+    Returns:
+        Hex digest identifying this combination of inputs
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(Path(path).name).encode("utf-8"))
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CheckpointStore:
+    """Checkpoint DataFrames to a work directory keyed by an input fingerprint.
+
+    Checkpoints are pickled DataFrames, which round-trip dtypes exactly and are
+    fast to read and write locally. A manifest records completed stages and
+    partitions; it is discarded whenever the input fingerprint changes.
+    """
+
+    def __init__(self, work_dir: str, fingerprint: str, resume: bool = False):
+        """Open a checkpoint store.
+
+        Args:
+            work_dir: Directory holding checkpoints and the manifest
+            fingerprint: Fingerprint of the current inputs
+            resume: Keep existing checkpoints if their fingerprint matches
+        """
+        self.work_dir = Path(work_dir)
+        self.fingerprint = fingerprint
+        self.resumed = False
+        manifest = self._read_manifest()
+        if resume and manifest is not None and manifest.get("fingerprint") == fingerprint:
+            self.manifest = manifest
+            self.resumed = True
+        else:
+            self.clear()
+            self.manifest = {"fingerprint": fingerprint, "stages": {}, "partitions": {}}
+            self._write_manifest()
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        path = self.work_dir / MANIFEST_NAME
+        if not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self):
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.work_dir / f"{MANIFEST_NAME}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.work_dir / MANIFEST_NAME)
+
+    def _write_frame(self, df: pd.DataFrame, file_name: str):
+        tmp_path = self.work_dir / f"{file_name}.tmp"
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, self.work_dir / file_name)
+
+    def clear(self):
+        """Remove this store's checkpoints and manifest from the work directory.
+
+        Only files the manifest lists or that follow the store's own naming
+        are removed, so a shared work directory keeps unrelated files.
+        """
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        names = set()
+        manifest = self._read_manifest() or {}
+        for entry in manifest.get("stages", {}).values():
+            names.add(entry["file"])
+        for partitions in manifest.get("partitions", {}).values():
+            names.update(entry["file"] for entry in partitions.values())
+        for pattern in CHECKPOINT_PATTERNS:
+            names.update(path.name for path in self.work_dir.glob(pattern))
+            names.update(path.name for path in self.work_dir.glob(f"{pattern}.tmp"))
+        for name in names:
+            (self.work_dir / Path(name).name).unlink(missing_ok=True)
+        (self.work_dir / MANIFEST_NAME).unlink(missing_ok=True)
+        (self.work_dir / f"{MANIFEST_NAME}.tmp").unlink(missing_ok=True)
+
+    def has_stage(self, name: str) -> bool:
+        """Return True if the stage was checkpointed for these inputs."""
+        return name in self.manifest["stages"]
+
+    def save_stage(self, name: str, df: pd.DataFrame, **meta: Any):
+        """Checkpoint the output of a completed stage.
+
+        Args:
+            name: Stage name
+            df: Stage output
+            **meta: Small JSON-serializable values to restore with the stage
+        """
+        file_name = f"stage-{name}{CHECKPOINT_SUFFIX}"
+        self._write_frame(df, file_name)
+        self.manifest["stages"][name] = {"file": file_name, "rows": len(df), "meta": meta}
+        self._write_manifest()
+
+    def load_stage(self, name: str) -> pd.DataFrame:
+        """Load a checkpointed stage output."""
+        return pd.read_pickle(self.work_dir / self.manifest["stages"][name]["file"])
+
+    def stage_meta(self, name: str) -> Dict[str, Any]:
+        """Return the metadata saved with a stage."""
+        return self.manifest["stages"][name]["meta"]
+
+    def has_partition(self, stage: str, index: int) -> bool:
+        """Return True if a partition of a stage was checkpointed."""
+        return str(index) in self.manifest["partitions"].get(stage, {})
+
+    def save_partition(self, stage: str, index: int, df: pd.DataFrame):
+        """Checkpoint one partition of a partitioned stage."""
+        file_name = f"{stage}-part-{index:05d}{CHECKPOINT_SUFFIX}"
+        self._write_frame(df, file_name)
+        self.manifest["partitions"].setdefault(stage, {})[str(index)] = {
+            "file": file_name,
+            "rows": len(df)
+        }
+        self._write_manifest()
+
+    def load_partition(self, stage: str, index: int) -> pd.DataFrame:
+        """Load a checkpointed partition."""
+        file_name = self.manifest["partitions"][stage][str(index)]["file"]
+        return pd.read_pickle(self.work_dir / file_name)
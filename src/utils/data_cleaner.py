@@ -1,8 +1,22 @@
 """Data cleaning utilities for the product merge application."""
 import re
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
+import numpy as np
 import pandas as pd
-from config.settings import VEHICLE_FIT_PREFIX
+from config.settings import VEHICLE_FIT_PREFIX, PROGRESS_VALUE_BATCH
+
+def as_text(series: pd.Series) -> pd.Series:
+    """Convert a Series to text, keeping string-dtype columns in their own storage.
+
+    Args:
+        series: Input Series
+
+    Returns:
+        Series of str values (object dtype) or the original string-dtype Series
+    """
+    if isinstance(series.dtype, pd.StringDtype):
+        return series
+    return series.astype(str)
 
 def normalize_part_numbers(df: pd.DataFrame, column: str = "PartNumber") -> pd.DataFrame:
     """Normalize part numbers by converting to uppercase and removing whitespace.
@@ -14,7 +28,7 @@ def normalize_part_numbers(df: pd.DataFrame, column: str = "PartNumber") -> pd.D
     Returns:
         DataFrame with normalized part numbers
     """
-    return df.assign(**{column: df[column].astype(str).str.strip().str.upper()})
+    return df.assign(**{column: as_text(df[column]).str.strip().str.upper()})
 
 def clean_title(title: str) -> str:
     """Clean product title by removing quotes and ensuring proper format.
@@ -49,8 +63,71 @@ def normalize_model_year_range(text: str) -> str:
     
     return text
 
+def _split_arrow_bullets(bullets: pd.Series, separator: str, max_bullets: int) -> List[pd.Series]:
+    """Split Arrow-backed bullet text with pyarrow compute kernels.
+
+    Each value is padded with ``max_bullets`` separators so every split list has
+    at least ``max_bullets`` elements; the text never round-trips through Python
+    objects.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    values = pa.array(bullets.array)
+    padding = pa.scalar(separator * max_bullets, type=values.type)
+    padded = pc.binary_join_element_wise(values, padding, pa.scalar("", type=values.type))
+    parts = pc.split_pattern(padded, separator, max_splits=max_bullets)
+    columns = []
+    for i in range(max_bullets):
+        piece = pc.fill_null(pc.utf8_trim_whitespace(pc.list_element(parts, i)), "")
+        column = pd.Series(pd.arrays.ArrowStringArray(piece), index=bullets.index)
+        columns.append(column.astype(bullets.dtype))
+    return columns
+
+def apply_unique(series: pd.Series, func: Callable,
+                 on_rows: Optional[Callable[[int], None]] = None) -> pd.Series:
+    """Apply a function once per distinct value and broadcast results back.
+
+    Args:
+        series: Input Series
+        func: Element-wise function; missing values are passed through ``func`` once
+        on_rows: Called after each batch of distinct values with the number of
+            rows those values cover (the calls add up to ``len(series)``)
+
+    Returns:
+        Object Series aligned with ``series``
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    results = np.empty(len(uniques), dtype=object)
+    if on_rows is None:
+        results[:] = [func(value) for value in uniques]
+    else:
+        rows_per_value = np.bincount(codes, minlength=len(uniques))
+        for start in range(0, len(uniques), PROGRESS_VALUE_BATCH):
+            end = start + PROGRESS_VALUE_BATCH
+            results[start:end] = [func(value) for value in uniques[start:end]]
+            on_rows(int(rows_per_value[start:end].sum()))
+    return pd.Series(results[codes], index=series.index)
+
+def dedup_ratio(*columns: pd.Series) -> float:
+    """Return rows per distinct value (or value combination) across columns.
+
+    Args:
+        *columns: Aligned Series that together form the deduplication key
+
+    Returns:
+        Ratio of row count to distinct key count (1.0 means no duplicates)
+    """
+    if not len(columns[0]):
+        return 1.0
+    # Keep each column's dtype: to_numpy() would materialize Arrow strings and
+    # inferring str from object arrays would copy every value
+    unique = pd.DataFrame({i: col.reset_index(drop=True) for i, col in enumerate(columns)}).drop_duplicates()
+    return len(columns[0]) / len(unique)
+
 def split_bullets(df: pd.DataFrame, bullet_column: str = "Bullets", 
-                 separator: str = "@", max_bullets: int = 5) -> pd.DataFrame:
+                 separator: str = "@", max_bullets: int = 5,
+                 column_format: str = "bullet{:02d}") -> pd.DataFrame:
     """Split bullet points into separate columns.
     
     Args:
@@ -58,28 +135,41 @@ def split_bullets(df: pd.DataFrame, bullet_column: str = "Bullets",
         bullet_column: Column containing bullet points
         separator: Character used to separate bullets
         max_bullets: Maximum number of bullet columns to create
+        column_format: Format for bullet column names, given the 1-based bullet number
         
     Returns:
         DataFrame with split bullet columns
     """
     if bullet_column not in df.columns:
         return df
-        
+
+    # Split each distinct bullet text once and broadcast the results by code
+    codes, uniques = pd.factorize(df[bullet_column])
+    bullets = pd.Series(uniques)
+    if not isinstance(bullets.dtype, pd.StringDtype):
+        bullets = bullets.astype(str)
+
     # Replace separator if needed
-    df[bullet_column] = df[bullet_column].apply(
-        lambda x: x.replace(" | ", separator) if isinstance(x, str) else x
-    )
-    
-    # Split bullets into list
-    split_bullets = df[bullet_column].apply(
-        lambda x: [b.strip() for b in str(x).split(separator)] if pd.notnull(x) else []
-    )
-    
+    bullets = bullets.str.replace(" | ", separator, regex=False)
+    df[bullet_column] = bullets.array.take(codes, allow_fill=True)
+
+    # Count bullets per distinct text; missing values have none
+    if len(bullets):
+        max_bullets = min(max_bullets, int(bullets.str.count(re.escape(separator)).max()) + 1)
+    elif len(df):
+        max_bullets = 0
+
     # Create bullet columns
-    max_bullets = min(max_bullets, split_bullets.map(len).max())
-    for i in range(max_bullets):
-        df[f"bullet{i+1:02d}"] = split_bullets.apply(
-            lambda b: b[i] if i < len(b) else ""
-        )
-    
-    return df 
\ No newline at end of file
+    if isinstance(bullets.dtype, pd.StringDtype) and bullets.dtype.storage == "pyarrow":
+        columns = _split_arrow_bullets(bullets, separator, max_bullets)
+    else:
+        # Split at most max_bullets times so extra bullets never widen the frame
+        parts = bullets.str.split(separator, n=max_bullets, expand=True, regex=False)
+        columns = [
+            parts[i].str.strip().fillna("") if i in parts.columns else pd.Series("", index=bullets.index)
+            for i in range(max_bullets)
+        ]
+    for i, column in enumerate(columns):
+        df[column_format.format(i + 1)] = column.array.take(codes, allow_fill=True, fill_value="")
+
+    return df
@@ -1,28 +1,80 @@
-"""Logging configuration for the product merge application."""
+"""Logging configuration for the product merge application.
+
+Loggers never write to disk themselves. Each one gets a single ``QueueHandler``;
+one ``QueueListener`` per log file drains the queue on a background thread
+straight into a file handler, so logging calls on the hot path only enqueue a
+record and every record reaches the file as soon as the listener handles it.
+"""
+import atexit
 import logging
-from typing import Optional
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 from config.settings import LOG_FILE, LOG_FORMAT, LOG_DATE_FORMAT
 
+# One (queue, listener) pair per resolved log file path
+_listeners: Dict[str, Tuple[queue.Queue, QueueListener]] = {}
+
+
+def _file_target(log_file: str) -> logging.Handler:
+    """Build the file handler a listener writes to."""
+    file_handler = logging.FileHandler(log_file, delay=True, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+    return file_handler
+
+
+def get_log_queue(log_file: Optional[str] = None) -> queue.Queue:
+    """Return the queue feeding a log file, starting its listener on first use.
+
+    Args:
+        log_file: Optional path to the log file. If None, uses default from settings
+
+    Returns:
+        Queue drained into the log file by a background listener
+    """
+    key = str(Path(log_file or LOG_FILE).resolve())
+    if key not in _listeners:
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, _file_target(key))
+        listener.start()
+        _listeners[key] = (log_queue, listener)
+    return _listeners[key][0]
+
+
+def _attach_queue(logger: logging.Logger, log_queue) -> logging.Logger:
+    if not any(isinstance(h, QueueHandler) and h.queue is log_queue for h in logger.handlers):
+        logger.addHandler(QueueHandler(log_queue))
+    return logger
+
+
 def setup_logger(name: str = __name__, log_file: Optional[str] = None) -> logging.Logger:
     """Configure and return a logger instance.
-    
+
+    Safe to call repeatedly: a logger gets at most one handler per log file.
+
     Args:
         name: The name of the logger instance
         log_file: Optional path to the log file. If None, uses default from settings
-        
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
+    return _attach_queue(logger, get_log_queue(log_file))
 
-    # File handler
-    file_handler = logging.FileHandler(log_file or LOG_FILE)
-    file_formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
-    return logger
+def shutdown_logging():
+    """Drain all queues and flush log files. Registered to run at exit."""
+    while _listeners:
+        _, (_, listener) = _listeners.popitem()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
 
 # Create default logger instance
-logger = setup_logger() 
\ No newline at end of file
+logger = setup_logger()
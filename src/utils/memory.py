@@ -0,0 +1,212 @@
+"""Memory budget enforcement for runs with ``--max-memory``.
+
+The governor sizes batches from bytes-per-row estimates taken on samples of
+the frames being processed, watches the process RSS while they run, and under
+pressure spills finished partitions to disk and shrinks later batches.
+"""
+import os
+import re
+import sys
+from typing import Callable, Iterator, Optional, Union
+import pandas as pd
+from config.settings import MEMORY_HIGH_WATER, MEMORY_SAMPLE_ROWS, MEMORY_WORK_FACTOR, MIN_WORK_ROWS
+
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_memory_size(value: str) -> int:
+    """Parse a memory size such as ``512M``, ``4G``, ``1.5GiB`` or a byte count.
+
+    Raises:
+        ValueError: If the value is not a non-negative size
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*", str(value), re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"invalid memory size {value!r} (use e.g. 512M or 4G)")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count with a binary unit, e.g. ``1.5 GiB``."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size:.0f} B"
+        size /= 1024
+    return f"{size:.1f} TiB"
+
+
+def current_rss() -> Optional[int]:
+    """Return the resident set size of this process in bytes, if it can be read."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def peak_rss() -> Optional[int]:
+    """Return the highest RSS this process has reached, in bytes, if known."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def frame_row_bytes(df: pd.DataFrame, sample_rows: int = MEMORY_SAMPLE_ROWS) -> float:
+    """Estimate the in-memory bytes per row of a frame from evenly spaced sample rows.
+
+    Args:
+        df: Frame to measure
+        sample_rows: Rows to measure (deep, i.e. including string payloads)
+
+    Returns:
+        Bytes per row, or 0.0 for an empty frame
+    """
+    if len(df) == 0:
+        return 0.0
+    step = max(len(df) // sample_rows, 1)
+    sample = df.iloc[::step]
+    return float(sample.memory_usage(index=False, deep=True).sum()) / len(sample)
+
+
+class MemoryGovernor:
+    """Keeps a run under a memory budget by sizing batches and spilling to disk.
+
+    A governor with a budget of 0 is disabled: it never samples RSS, hands out
+    whole frames as single batches and never asks for spilling, so callers use
+    the same code path with or without a budget.
+    """
+
+    def __init__(self, max_bytes: int, high_water: float = MEMORY_HIGH_WATER,
+                 min_rows: int = MIN_WORK_ROWS):
+        """Create a governor.
+
+        Args:
+            max_bytes: Memory budget in bytes; 0 disables the governor
+            high_water: Fraction of the budget at which RSS counts as pressure
+            min_rows: Smallest batch the governor shrinks to
+        """
+        self.max_bytes = max_bytes
+        self.high_water_bytes = int(max_bytes * high_water)
+        self.min_rows = min_rows
+        # Rows per batch; None hands out whole frames
+        self.work_rows: Optional[int] = None
+        # Set once finished partitions should live on disk instead of in memory
+        self.spilling = False
+        # Batch checks that found RSS above the high-water mark (reported in the run summary)
+        self.pressure_events = 0
+        self._rss_at_shrink = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _rss(self) -> Optional[int]:
+        return current_rss() if self.enabled else None
+
+    def headroom(self) -> Optional[int]:
+        """Bytes left below the high-water mark (negative when above it), if RSS is known."""
+        rss = self._rss()
+        return None if rss is None else self.high_water_bytes - rss
+
+    def chunk_rows(self, row_bytes: float, limit: int, reserve: float = 0) -> int:
+        """Return the rows per batch that fit the current headroom.
+
+        Args:
+            row_bytes: Estimated in-memory bytes per row
+            limit: Configured batch size, never exceeded
+            reserve: Bytes of the headroom to keep free for other data
+
+        Returns:
+            Rows per batch, a multiple of ``min_rows`` between ``min_rows`` and ``limit``
+        """
+        headroom = self.headroom()
+        if headroom is None or row_bytes <= 0:
+            return limit
+        rows = int((headroom - reserve) / (row_bytes * MEMORY_WORK_FACTOR))
+        rows -= rows % self.min_rows
+        return min(limit, max(rows, self.min_rows))
+
+    def size_batches(self, df: pd.DataFrame, limit: int, reserve: float = 0):
+        """Set the batch size for processing a resident frame.
+
+        Args:
+            df: Frame about to be processed in batches
+            limit: Largest batch size
+            reserve: Bytes of the headroom to keep free for other data
+        """
+        if self.enabled:
+            self.work_rows = self.chunk_rows(frame_row_bytes(df), limit, reserve)
+
+    def plan_enrichment(self, df: pd.DataFrame, chunk_size: int):
+        """Choose the enrichment batch size and whether to spill partitions.
+
+        Finished partitions are kept in memory only if both the input frame
+        and a full enriched copy of it fit below the high-water mark.
+
+        Args:
+            df: Merged frame about to be enriched (already resident)
+            chunk_size: Rows per checkpointed partition
+        """
+        headroom = self.headroom()
+        if headroom is None or len(df) == 0:
+            return
+        row_bytes = frame_row_bytes(df)
+        output_bytes = row_bytes * len(df)
+        self.spilling = headroom < output_bytes + row_bytes * self.min_rows * MEMORY_WORK_FACTOR
+        reserve = row_bytes * min(chunk_size, len(df)) if self.spilling else output_bytes
+        self.work_rows = self.chunk_rows(row_bytes, chunk_size, reserve)
+
+    def check(self) -> bool:
+        """Sample RSS and react to pressure.
+
+        The first time RSS crosses the high-water mark the governor starts
+        spilling; after that it halves the batch size whenever RSS is still
+        higher than at the previous reaction (freed memory is not always
+        returned to the OS, so a flat RSS is not treated as growth).
+
+        Returns:
+            True if RSS is above the high-water mark
+        """
+        rss = self._rss()
+        if rss is None or rss < self.high_water_bytes:
+            return False
+        self.pressure_events += 1
+        if not self.spilling:
+            self.spilling = True
+        elif rss > self._rss_at_shrink and self.work_rows is not None:
+            self.work_rows = max(self.min_rows, self.work_rows // 2)
+        self._rss_at_shrink = max(self._rss_at_shrink, rss)
+        return True
+
+    def batches(self, df: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """Split a frame into batches, checking memory before each one."""
+        if not self.enabled:
+            yield df
+            return
+        start = 0
+        while start < len(df):
+            self.check()
+            rows = self.work_rows or len(df)
+            yield df.iloc[start:start + rows]
+            start += rows
+
+    def map_batches(self, df: pd.DataFrame,
+                    func: Callable[[pd.DataFrame], Union[pd.DataFrame, pd.Series]]) -> Union[pd.DataFrame, pd.Series]:
+        """Apply a row-wise function batch by batch and concatenate the results in order.
+
+        An empty frame yields no batches; the function is then applied to it
+        directly so the result keeps its columns and dtypes.
+        """
+        results = [func(batch) for batch in self.batches(df)]
+        if not results:
+            return func(df)
+        return results[0] if len(results) == 1 else pd.concat(results)
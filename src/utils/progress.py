@@ -0,0 +1,129 @@
+"""Rich progress bars with row counts, throughput and ETA for pipeline stages."""
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    ProgressColumn,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn
+)
+from rich.text import Text
+from config.settings import PROGRESS_MIN_INTERVAL
+
+
+class RowSpeedColumn(ProgressColumn):
+    """Rows per second, from rich's moving speed estimate."""
+
+    def render(self, task) -> Text:
+        if task.finished and task.finished_time:
+            # Average over the whole stage; rich only estimates speed while running
+            speed = task.completed / task.finished_time
+        else:
+            speed = task.speed
+        if speed is None:
+            return Text("- rows/s", style="progress.data.speed")
+        return Text(f"{speed:,.0f} rows/s", style="progress.data.speed")
+
+
+class StageProgress:
+    """Progress of one stage, measured in rows.
+
+    ``advance`` only accumulates; the bar is updated at most once per
+    ``min_interval`` seconds, so callers can report every chunk (or block)
+    without the bookkeeping showing up in profiles.
+    """
+
+    def __init__(self, progress: Optional[Progress], task_id: Optional[int], min_interval: float):
+        self._progress = progress
+        self._task_id = task_id
+        self._min_interval = min_interval
+        self._pending = 0
+        self._completed = 0
+        self._last_update = time.monotonic()
+
+    def advance(self, rows: int):
+        """Count ``rows`` more rows as processed."""
+        self._pending += rows
+        self._completed += rows
+        now = time.monotonic()
+        if self._progress is not None and now - self._last_update >= self._min_interval:
+            self._progress.advance(self._task_id, self._pending)
+            self._pending = 0
+            self._last_update = now
+
+    def describe(self, description: str):
+        """Replace the stage description, e.g. with the current partition."""
+        if self._progress is not None:
+            self._progress.update(self._task_id, description=description)
+
+    def finish(self, rows: Optional[int] = None):
+        """Mark the stage complete, optionally with its final row count."""
+        if rows is not None:
+            self._completed = rows
+        self._pending = 0
+        if self._progress is not None:
+            self._progress.update(self._task_id, total=self._completed, completed=self._completed)
+
+
+class PipelineProgress:
+    """Live progress display with one bar per stage.
+
+    Disabled instances hand out no-op stages, so callers never need to check
+    whether progress is shown.
+    """
+
+    def __init__(self, enabled: bool = True, console: Optional[Console] = None,
+                 min_interval: float = PROGRESS_MIN_INTERVAL):
+        """Create the display.
+
+        Args:
+            enabled: Show progress bars
+            console: Console to render to (defaults to a new stdout console)
+            min_interval: Minimum seconds between updates of one bar
+        """
+        self.min_interval = min_interval
+        self._progress = None
+        if enabled:
+            self._progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                RowSpeedColumn(),
+                TimeElapsedColumn(),
+                TextColumn("ETA"),
+                TimeRemainingColumn(),
+                console=console,
+                refresh_per_second=max(1.0, 1 / min_interval)
+            )
+
+    def start(self):
+        """Start rendering the bars."""
+        if self._progress is not None:
+            self._progress.start()
+
+    def stop(self):
+        """Stop rendering, leaving the final state on screen (safe to call twice)."""
+        if self._progress is not None:
+            self._progress.stop()
+
+    @contextmanager
+    def stage(self, description: str, total: Optional[int] = None) -> Iterator[StageProgress]:
+        """Show a bar for one stage and complete it when the block exits normally.
+
+        Args:
+            description: Stage label
+            total: Expected rows, if known (without it no ETA is shown)
+        """
+        task_id = None
+        if self._progress is not None:
+            task_id = self._progress.add_task(description, total=total)
+        stage = StageProgress(self._progress, task_id, self.min_interval)
+        yield stage
+        stage.finish()
@@ -0,0 +1,91 @@
+"""Per-step tracing of description normalization for sampled rows."""
+import json
+import time
+import zlib
+from typing import Callable, Iterable, List, Optional, Tuple
+import pandas as pd
+
+# Resolution of the deterministic sampling hash
+SAMPLE_BUCKETS = 1_000_000
+
+
+class NormalizationTracer:
+    """Record each normalization step's input, output and time for selected rows.
+
+    Rows are selected by PartNumber, either explicitly or by a deterministic hash
+    sample, so the same rows are traced on every run. Only selected rows are
+    re-run step by step; the pipeline itself is untouched, and callers pass no
+    tracer at all when tracing is disabled.
+    """
+
+    def __init__(self, trace_file: str, sample_rate: float = 0.0,
+                 part_numbers: Optional[Iterable[str]] = None):
+        """Create a tracer.
+
+        Args:
+            trace_file: JSONL file that trace records are appended to
+            sample_rate: Fraction of rows (0-1) to trace
+            part_numbers: PartNumbers to always trace
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self.trace_file = trace_file
+        self.sample_rate = sample_rate
+        self.part_numbers = {str(p).strip().upper() for p in part_numbers or []}
+        self.rows_traced = 0
+        self._file = None
+
+    def _sampled(self, part_number: str) -> bool:
+        bucket = zlib.crc32(part_number.encode("utf-8")) % SAMPLE_BUCKETS
+        return bucket < self.sample_rate * SAMPLE_BUCKETS
+
+    def select(self, df: pd.DataFrame) -> pd.Series:
+        """Return a boolean mask of the rows to trace."""
+        part_numbers = df["PartNumber"].astype(str)
+        selected = part_numbers.isin(self.part_numbers)
+        if self.sample_rate > 0:
+            selected |= part_numbers.map(self._sampled).astype(bool)
+        return selected
+
+    def _write(self, record: dict):
+        if self._file is None:
+            self._file = open(self.trace_file, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def trace_steps(self, df: pd.DataFrame, column: str,
+                    steps: List[Tuple[str, Callable]]):
+        """Run the steps on the selected rows and record every transition.
+
+        Args:
+            df: Frame about to be normalized
+            column: Column the steps are applied to
+            steps: Ordered (name, function) pairs as applied by the pipeline
+        """
+        selected = df[self.select(df)]
+        for part_number, text in zip(selected["PartNumber"], selected[column]):
+            for name, step in steps:
+                start = time.perf_counter()
+                result = step(text)
+                elapsed = time.perf_counter() - start
+                self._write({
+                    "PartNumber": str(part_number),
+                    "step": name,
+                    "before": text if isinstance(text, str) else None,
+                    "after": result if isinstance(result, str) else None,
+                    "changed": text != result if isinstance(text, str) else False,
+                    "elapsed_us": round(elapsed * 1e6, 2)
+                })
+                text = result
+            self.rows_traced += 1
+
+    def close(self):
+        """Flush and close the trace file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()